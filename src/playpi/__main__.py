@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 import fire
+from loguru import logger
 from rich.console import Console
 
 from playpi.exceptions import PlayPiError
@@ -40,7 +41,10 @@ def _print_result(result: Any, *, success_message: str | None = None) -> None:
         return
     if isinstance(result, list | tuple):
         for item in result:
-            _console.print(item)
+            if isinstance(item, Exception):
+                _console.print(f"❌ Error: {item}", style="red")
+            else:
+                _console.print(item)
         return
     _console.print(result)
 
@@ -69,10 +73,13 @@ def gemi(
     _print_result(result, success_message=message)
 
 
-def gemi_dr() -> None:
+def gemi_dr(*, max_concurrency: int | None = None, qpm: int | None = None) -> None:
     """Execute multiple Deep Research jobs via JSON config from stdin."""
-    result = _run_command(cli_helpers.gemi_dr_command())
+    result = _run_command(cli_helpers.gemi_dr_command(max_concurrency=max_concurrency, qpm=qpm))
     _print_result(result)
+    # Failed jobs come back as exceptions alongside the successful results
+    if any(isinstance(item, Exception) for item in result or ()):
+        sys.exit(1)
 
 
 def test(verbose: bool = True) -> None:
@@ -83,6 +90,9 @@ def test(verbose: bool = True) -> None:
 
 def main() -> None:
     """Entrypoint mapping CLI commands."""
+    # The CLI owns the process's log output: drop loguru's default stderr sink so
+    # messages only appear when a command is run with verbose=True
+    logger.remove()
     fire.Fire(
         {
             "gemi": gemi,
@@ -25,12 +25,17 @@ class PlayPiConfig:
             diagnostic logs.
         profile: Named profile handled by playwrightauthor; allows multiple
             authenticated browser states.
+        block_telemetry: Abort Google analytics and logging requests in the
+            session's browser context. Off by default: Playwright disables the
+            HTTP cache for any routed context, which costs more on repeated
+            Gemini page loads than the beacons it saves.
     """
 
     headless: bool = True
     timeout: int = 30_000
     verbose: bool = False
     profile: str = "default"
+    block_telemetry: bool = False
 
     def playwrightauthor_kwargs(self) -> dict[str, object]:
         """Return keyword arguments accepted by playwrightauthor context managers."""
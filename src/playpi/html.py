@@ -5,12 +5,34 @@ import html2text
 from loguru import logger
 from playwright.async_api import Page
 
-
-def html_to_markdown(html_content: str) -> str:
+# Candidate containers for the finished research response, most specific first.
+# These selectors may need updating based on current Gemini UI.
+CONTENT_SELECTORS = (
+    '[data-test-id="scroll-container"]',
+    ".research-content",
+    ".response-container",
+    'main [role="main"]',
+    "article",
+)
+
+
+# First of the given selectors present in the page, with its inner HTML; null if none is
+_FIRST_CONTENT_HTML_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) return [selector, element.innerHTML];
+    }
+    return null;
+}"""
+
+
+def html_to_markdown(html_content: str, *, keep_images: bool = False) -> str:
     """Convert HTML content to clean Markdown.
 
     Args:
         html_content: Raw HTML content
+        keep_images: Emit Markdown image references for ``<img>`` tags. Gemini
+            responses rarely carry meaningful images, so they are skipped by default.
 
     Returns:
         Clean Markdown text
@@ -18,7 +40,7 @@ def html_to_markdown(html_content: str) -> str:
     # Configure html2text for clean output
     h = html2text.HTML2Text()
     h.ignore_links = False
-    h.ignore_images = False
+    h.ignore_images = not keep_images
     h.body_width = 0  # Don't wrap lines
     h.unicode_snob = True
     h.skip_internal_links = True
@@ -53,28 +75,12 @@ async def extract_research_content(page: Page) -> str:
         # Wait for research results to be available
         logger.debug("Waiting for research content to load")
 
-        # Try to find the main content container
-        # This selector may need updating based on current Gemini UI
-        content_selectors = [
-            '[data-test-id="scroll-container"]',
-            ".research-content",
-            ".response-container",
-            'main [role="main"]',
-            "article",
-        ]
-
+        # Probe every candidate in priority order within a single evaluate
+        match = await page.evaluate(_FIRST_CONTENT_HTML_JS, list(CONTENT_SELECTORS))
         content_html = ""
-        for selector in content_selectors:
-            try:
-                logger.debug(f"Trying selector: {selector}")
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    content_html = await element.inner_html()
-                    logger.debug(f"Found content with selector: {selector}")
-                    break
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
+        if match:
+            selector, content_html = match
+            logger.debug(f"Found content with selector: {selector}")
 
         if not content_html:
             # Fallback: get all text content from body
@@ -5,8 +5,10 @@ from playpi.providers.google.gemini import (
     google_gemini_ask,
     google_gemini_ask_deep_think,
     google_gemini_deep_research,
+    google_gemini_deep_research_batch,
     google_gemini_deep_research_full,
     google_gemini_deep_research_multi,
+    google_gemini_deep_research_stream,
     google_gemini_generate_image,
 )
 
@@ -15,7 +17,9 @@ __all__ = [
     "google_gemini_ask",
     "google_gemini_ask_deep_think",
     "google_gemini_deep_research",
+    "google_gemini_deep_research_batch",
     "google_gemini_deep_research_full",
     "google_gemini_deep_research_multi",
+    "google_gemini_deep_research_stream",
     "google_gemini_generate_image",
 ]
@@ -9,6 +9,11 @@ from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from playpi.exceptions import AuthenticationError
 
+# Login polling starts tight to catch an already-restored session, then backs off
+LOGIN_POLL_MIN_INTERVAL = 0.25
+LOGIN_POLL_MAX_INTERVAL = 2.0
+LOGIN_POLL_BACKOFF = 1.5
+
 
 async def ensure_authenticated(page: Page, timeout: int) -> None:
     """Prompt the user to authenticate with Gemini if required.
@@ -22,12 +27,15 @@ async def ensure_authenticated(page: Page, timeout: int) -> None:
         msg = "Authentication disabled for this environment."
         raise AuthenticationError(msg)
 
-    login_deadline = asyncio.get_running_loop().time() + min(timeout, 60)
+    now = asyncio.get_running_loop().time
+    login_deadline = now() + min(timeout, 60)
     prompt_displayed = False
+    poll_interval = LOGIN_POLL_MIN_INTERVAL
 
     while True:
         try:
-            await page.wait_for_load_state("networkidle", timeout=5000)  # Reduced timeout
+            # Gemini keeps streaming connections open, so "networkidle" never settles
+            await page.wait_for_load_state("domcontentloaded", timeout=5000)
         except PlaywrightTimeoutError:
             logger.debug("Waiting for Gemini load state timed out; checking for chat interface")
             # Continue probing authentication state
@@ -47,11 +55,12 @@ async def ensure_authenticated(page: Page, timeout: int) -> None:
         if "accounts.google.com" in current_url or "signin" in current_url:
             logger.info("🔑 Google sign-in page detected - waiting for authentication...")
 
-        if asyncio.get_running_loop().time() > login_deadline:
+        if now() > login_deadline:
             msg = "Gemini chat interface not found after waiting for login."
             raise AuthenticationError(msg)
 
-        await asyncio.sleep(1)  # Reduced sleep time for faster checks
+        await asyncio.sleep(poll_interval)
+        poll_interval = min(poll_interval * LOGIN_POLL_BACKOFF, LOGIN_POLL_MAX_INTERVAL)
 
 
 async def has_chat_interface(page: Page) -> bool:
@@ -3,15 +3,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import mmap
+import os
+import stat
 import sys
+import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from playpi.config import PlayPiConfig
 from playpi.providers.google.gemini import (
+    DeepResearchJob,
     google_gemini_ask,
     google_gemini_ask_deep_think,
     google_gemini_deep_research,
@@ -19,8 +27,94 @@ from playpi.providers.google.gemini import (
 )
 from playpi.session import create_session
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+try:  # orjson parses bytes directly and is considerably faster on large payloads
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
 _stdin = sys.stdin
 
+# gemi_command dispatch table indexed by the `deep` flag
+_GEMI_PROVIDERS = (google_gemini_ask, google_gemini_ask_deep_think)
+
+_WRITE_CHUNK_SIZE = 65_536
+
+
+def _write_text_chunked(path: Path, text: str) -> None:
+    """Write UTF-8 text through a buffered writer, encoding one chunk at a time.
+
+    Avoids materialising a second, fully encoded copy of multi-megabyte results.
+    """
+    with path.open("wb", buffering=_WRITE_CHUNK_SIZE) as handle:
+        for start in range(0, len(text), _WRITE_CHUNK_SIZE):
+            handle.write(text[start : start + _WRITE_CHUNK_SIZE].encode("utf-8"))
+
+
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+def _read_prompt_file(path: Path) -> str:
+    """Read a UTF-8 prompt file without trailing whitespace.
+
+    Regular files are memory-mapped and trailing whitespace is trimmed before
+    decoding, so only the needed bytes are copied out of the page cache. Pipes,
+    FIFOs and other streams (``<(cmd)``, ``/dev/stdin``) are read normally.
+    Line endings are normalised to ``\\n``, as in text mode.
+    """
+    with path.open("rb") as handle:
+        info = os.fstat(handle.fileno())
+        if not stat.S_ISREG(info.st_mode):
+            text = handle.read().decode("utf-8")
+        elif info.st_size == 0:
+            return ""
+        else:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                end = len(mapped)
+                while end and mapped[end - 1] in _ASCII_WHITESPACE:
+                    end -= 1
+                text = mapped[:end].decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n").rstrip()
+
+
+# One lock and its number of holders or waiters per prompt digest in flight, so
+# concurrent duplicate requests run the research once. Entries are dropped when
+# their last user is done, so no lock outlives the event loop it was used on.
+_research_cache_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+@asynccontextmanager
+async def _research_cache_lock(digest: str) -> AsyncIterator[None]:
+    """Hold the lock for ``digest`` while its cache entry is checked or written."""
+    lock, users = _research_cache_locks.get(digest) or (asyncio.Lock(), 0)
+    _research_cache_locks[digest] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _research_cache_locks[digest]
+        if users == 1:
+            del _research_cache_locks[digest]
+        else:
+            _research_cache_locks[digest] = (lock, users - 1)
+
+
+def _write_cache_entry(path: Path, text: str) -> None:
+    """Atomically store a cached result so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as handle:
+            temp_path = Path(handle.name)
+            handle.write(text.encode("utf-8"))
+        temp_path.replace(path)
+    except BaseException:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        raise
+
 
 async def google_research_command(
     prompt: str,
@@ -29,18 +123,40 @@ async def google_research_command(
     headless: bool = True,
     timeout: int = 600,
     verbose: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> str | Path:
-    """Run Deep Research and optionally persist the result."""
-    result = await google_gemini_deep_research(
-        prompt,
-        headless=headless,
-        timeout=timeout,
-        verbose=verbose,
-    )
+    """Run Deep Research and optionally persist the result.
+
+    When ``cache_dir`` is given, results are stored there keyed by the SHA-256 of
+    the prompt and identical prompts are answered from disk. Pass no
+    ``cache_dir`` to always run a fresh research.
+    """
+    if cache_dir is None:
+        result = await google_gemini_deep_research(
+            prompt,
+            headless=headless,
+            timeout=timeout,
+            verbose=verbose,
+        )
+    else:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        cache_path = Path(cache_dir) / f"{digest}.md"
+        async with _research_cache_lock(digest):
+            if await asyncio.to_thread(cache_path.is_file):
+                logger.debug(f"Deep Research cache hit: {cache_path}")
+                result = await asyncio.to_thread(cache_path.read_text, encoding="utf-8")
+            else:
+                result = await google_gemini_deep_research(
+                    prompt,
+                    headless=headless,
+                    timeout=timeout,
+                    verbose=verbose,
+                )
+                await asyncio.to_thread(_write_cache_entry, cache_path, result)
 
     if output:
         output_path = Path(output)
-        output_path.write_text(result, encoding="utf-8")
+        await asyncio.to_thread(_write_text_chunked, output_path, result)
         return output_path
     return result
 
@@ -54,47 +170,85 @@ async def gemi_command(
     verbose: bool = False,
 ) -> str | Path:
     """Execute a Gemini prompt, optionally in Deep Think mode."""
-    parts: list[str] = []
-    if file_prompt:
-        parts.append(Path(file_prompt).read_text(encoding="utf-8").rstrip())
-    if prompt:
-        parts.append(prompt)
-
-    if not parts:
+    file_text = await asyncio.to_thread(_read_prompt_file, Path(file_prompt)) if file_prompt else ""
+    full_prompt = f"{file_text}\n{prompt}" if file_text and prompt else file_text or prompt
+    if not full_prompt:
         msg = "Provide --prompt, --file_prompt, or both."
         raise ValueError(msg)
 
-    full_prompt = "\n".join(part for part in parts if part)
-    provider = google_gemini_ask_deep_think if deep else google_gemini_ask
+    provider = _GEMI_PROVIDERS[bool(deep)]
     result = await provider(full_prompt, verbose=verbose)
 
     if output_file:
         output_path = Path(output_file)
-        output_path.write_text(result, encoding="utf-8")
+        await asyncio.to_thread(_write_text_chunked, output_path, result)
         return output_path
     return result
 
 
-async def gemi_dr_command() -> Any:
-    """Run multiple Deep Research tasks using JSON read from stdin."""
-    raw = _stdin.read()
-    if not raw.strip():
-        msg = "No JSON payload supplied on stdin."
-        raise ValueError(msg)
-
+def _parse_jobs_payload(raw: str | bytes) -> Any:
+    """Parse a JSON document, falling back to JSON Lines (one job per line)."""
     try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        msg = "stdin does not contain valid JSON"
-        raise ValueError(msg) from exc
+        return _json_loads(raw)
+    except json.JSONDecodeError as exc:  # orjson.JSONDecodeError subclasses this
+        lines = [line for line in raw.splitlines() if line.strip()]
+        if len(lines) <= 1:
+            msg = "stdin does not contain valid JSON"
+            raise ValueError(msg) from exc
+        try:
+            return [_json_loads(line) for line in lines]
+        except json.JSONDecodeError:
+            msg = "stdin does not contain valid JSON or JSON Lines"
+            raise ValueError(msg) from exc
+
+
+_JOB_FIELDS = frozenset(DeepResearchJob.__annotations__)
+
 
+def _coerce_jobs(payload: Any) -> list[DeepResearchJob]:
+    """Normalise a parsed payload to a list of typed Deep Research jobs."""
     if isinstance(payload, dict):
         payload = [payload]
     if not isinstance(payload, list):
         msg = "Deep Research config must be a list of jobs."
         raise ValueError(msg)
 
-    return await google_gemini_deep_research_multi(payload)
+    # Validate the whole batch before any browser work and report every problem at once
+    errors: list[str] = []
+    for index, job in enumerate(payload):
+        if not isinstance(job, dict):
+            errors.append(f"job {index} must be a JSON object")
+            continue
+        errors.extend(
+            f"job {index}: '{field}' must be a string"
+            for field in sorted(_JOB_FIELDS.intersection(job))
+            if not isinstance(job[field], str)
+        )
+        if not (job.get("prompt") or job.get("prompt_path")):
+            errors.append(f"job {index}: provide 'prompt' or 'prompt_path'")
+
+    if errors:
+        msg = "Invalid Deep Research config: " + "; ".join(errors)
+        raise ValueError(msg)
+    return payload
+
+
+async def gemi_dr_command(*, max_concurrency: int | None = None, qpm: int | None = None) -> Any:
+    """Run multiple Deep Research tasks using JSON or JSON Lines read from stdin."""
+    # Read raw bytes when available so the payload is never decoded to str first
+    raw = getattr(_stdin, "buffer", _stdin).read()
+    # isspace() stops at the first non-whitespace byte; strip() would copy the whole payload
+    if not raw or raw.isspace():
+        msg = "No JSON payload supplied on stdin."
+        raise ValueError(msg)
+
+    payload = _parse_jobs_payload(raw)
+
+    jobs = _coerce_jobs(payload)
+    # Report every job's outcome, so one failed job does not discard the finished ones
+    return await google_gemini_deep_research_multi(
+        jobs, max_concurrency=max_concurrency, qpm=qpm, return_exceptions=True
+    )
 
 
 async def test_session_command(*, verbose: bool = True) -> str:
@@ -104,5 +258,5 @@ async def test_session_command(*, verbose: bool = True) -> str:
         page = await session.get_page()
         await page.goto("https://httpbin.org/json")
         title = await page.title()
-        logger.debug(f"Session test navigated to {title}")
+        logger.debug("Session test navigated to {}", title)
         return f"Browser session available (title: {title})"
@@ -1,32 +1,253 @@
 """Google Gemini provider for PlayPi package."""
 
 import asyncio
+import contextlib
 import os
 import pathlib
-import shutil
+import re
 import sys
+import threading
+from collections.abc import AsyncIterator
+from typing import TypedDict
 
 from loguru import logger
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-from playwrightauthor.helpers.extraction import async_extract_with_fallbacks
-from playwrightauthor.utils.html import html_to_markdown
 
 from playpi.config import PlayPiConfig
 from playpi.exceptions import PlayPiTimeoutError, ProviderError
+from playpi.html import extract_research_content, html_to_markdown
 from playpi.providers.google.auth import ensure_authenticated
-from playpi.session import create_session
+from playpi.session import PlayPiSession, create_session
+
+# playpi's own DEBUG stdout sink, present while verbose logging is on
+_verbose_lock = threading.Lock()
+_verbose_sink_id: int | None = None
 
 
 def _configure_logging(verbose: bool = False) -> None:
-    """Configure logging based on verbose flag."""
-    logger.remove()  # Remove all existing handlers
-    if verbose:
-        logger.add(sys.stdout, level="DEBUG")
-    # If not verbose, no handlers are added, so logging is suppressed
+    """Send playpi's log messages to stdout at DEBUG level, or silence them.
 
+    Only the stdout sink playpi itself added is ever removed, so sinks the
+    application configured are left alone. It is added at most once, however
+    many calls (one per job under the multi driver) ask for verbose output.
+    """
+    global _verbose_sink_id
+    with _verbose_lock:
+        if verbose:
+            logger.enable("playpi")
+            if _verbose_sink_id is None:
+                _verbose_sink_id = logger.add(sys.stdout, level="DEBUG")
+        else:
+            logger.disable("playpi")
+            if _verbose_sink_id is not None:
+                logger.remove(_verbose_sink_id)
+                _verbose_sink_id = None
 
+
+GEMINI_APP_URL = "https://gemini.google.com/u/0/app"
 RESEARCH_CONTENT_MIN_LENGTH = 50_000
+DEFAULT_CONCURRENCY = 3  # Deep Research jobs run at once unless PLAYPI_CONCURRENCY says otherwise
+CONFIRMATION_WAIT_MS = 15_000  # The confirmation widget shows up within seconds or not at all
+RENDER_QUIET_MS = 1_000  # A finished response has rendered once the DOM is unchanged this long
+RENDER_SETTLE_TIMEOUT_MS = 5_000  # Never wait for rendering longer than the old fixed pause
+RESPONSE_POLL_MS = 500  # How often the standard-response completion check runs in-page
+RESPONSE_STABLE_MS = 2_000  # Response text unchanged this long counts as finished
+
+# Candidate selectors, most specific first; probed together by `_wait_for_any`
+PROMPT_INPUT_SELECTORS = (
+    '[role="textbox"][aria-label="Enter a prompt here"]',
+    '[role="textbox"]',
+    ".text-input-field_textarea .ql-editor",
+    "rich-textarea .ql-editor",
+)
+MAIN_OUTPUT_SELECTORS = (
+    "message-content.model-response-text",  # Current Gemini UI with thinking
+    "message-content",  # Current Gemini UI
+    ".model-response-text",  # Alternative selector
+    ".markdown.markdown-main-panel",  # Content within message-content
+)
+RESPONSE_SELECTORS = (
+    "message-content",  # Current Gemini UI
+    "response-element",  # Legacy selector
+    ".model-response-text",  # Alternative selector
+    ".markdown.markdown-main-panel",  # Content within message-content
+)
+
+# Buttons that start the research in the Deep Research confirmation widget
+CONFIRMATION_BUTTON_SELECTORS = (
+    '[data-test-id="confirm-button"]',
+    "button:has-text('Start research')",
+    "button.confirm-button",
+)
+
+# The Tools drawer overlay listing Deep Research, Deep Think, Create images, ...
+TOOLBOX_DRAWER_SELECTOR = "#cdk-overlay-0 > mat-card"
+TOOLS_BUTTON_NAME = "Tools"  # Accessible name of the button that opens the drawer
+DEEP_THINK_BUTTON_SELECTOR = "button:has-text('Deep Think')"
+IMAGE_GENERATION_BUTTON_SELECTOR = "button:has-text('Create images')"
+
+# Composer, response and image controls
+SEND_BUTTON_SELECTOR = '.send-button-container button[data-test-id="send-button"]'
+DOWNLOAD_IMAGE_BUTTON_SELECTOR = '[data-test-id="download-generated-image-button"]'
+THINKING_BUTTON_SELECTOR = '[data-test-id="thoughts-header-button"]'
+THINKING_CONTENT_SELECTOR = '[data-test-id="thoughts-content"]'
+SOURCES_BUTTON_SELECTOR = 'button:has-text("Sources")'
+SOURCES_SIDEBAR_SELECTOR = "context-sidebar"
+
+# Elements that appear once Deep Research has finished (export button or similar)
+RESEARCH_COMPLETION_INDICATORS = (
+    '[data-test-id="export-menu-button"]',
+    'button:has-text("Export")',
+    'button:has-text("Copy")',
+    '[data-test-id="scroll-container"]',
+)
+
+# Whether Deep Research is selected. Checked at document level because the drawer
+# holding the tool button closes once it is picked.
+_DEEP_RESEARCH_ACTIVE_JS = """() => !!document.querySelector('button[aria-label*="Deselect Deep Research"]')
+    || Array.from(document.querySelectorAll('button[aria-pressed="true"]')).some(
+        (button) => button.textContent.includes("Deep Research")
+    )"""
+
+# Shared in-page waiter: resolves with the first truthy check() result, re-running the
+# check on every DOM mutation, or with null after timeoutMs. The observer is always
+# detached, so an abandoned wait leaves nothing running in the page.
+_OBSERVE_UNTIL_JS = """(check, timeoutMs) => new Promise((resolve) => {
+    const found = check();
+    if (found) return resolve(found);
+    let timer;
+    const observer = new MutationObserver(() => {
+        const result = check();
+        if (result) finish(result);
+    });
+    const finish = (result) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(result);
+    };
+    timer = setTimeout(() => finish(null), timeoutMs);
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+})"""
+
+# Resolves true once no DOM mutation has happened for quietMs, or false after timeoutMs
+_AWAIT_DOM_QUIET_JS = """([quietMs, timeoutMs]) => new Promise((resolve) => {
+    let quiet;
+    let limit;
+    const finish = (settled) => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(limit);
+        resolve(settled);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, quietMs, true);
+    });
+    quiet = setTimeout(finish, quietMs, true);
+    limit = setTimeout(finish, timeoutMs, false);
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+})"""
+
+# Resolves true once Deep Research shows as selected, or null after timeoutMs
+_AWAIT_DEEP_RESEARCH_ACTIVE_JS = (
+    "(timeoutMs) => (" + _OBSERVE_UNTIL_JS + ")(" + _DEEP_RESEARCH_ACTIVE_JS + ", timeoutMs)"
+)
+
+# Resolves with the first (css, text) marker matching a visible element, or null after timeoutMs
+_WAIT_FOR_MARKERS_JS = (
+    """([markers, timeoutMs]) => {
+    const visible = (el) => (el.checkVisibility ? el.checkVisibility() : el.getClientRects().length > 0);
+    return ("""
+    + _OBSERVE_UNTIL_JS
+    + """)(() => markers.find(([css, text]) => Array.from(document.querySelectorAll(css)).some(
+        (el) => (text === null || el.textContent.includes(text)) && visible(el)
+    )), timeoutMs);
+}"""
+)
+
+# Clicks the Tools drawer entry whose text contains the label as soon as it renders;
+# resolves true once clicked, or null if it does not show up within timeoutMs
+_CLICK_DRAWER_TOOL_JS = (
+    "([label, timeoutMs]) => ("
+    + _OBSERVE_UNTIL_JS
+    + """)(() => {
+    const button = Array.from(document.querySelectorAll("toolbox-drawer-item button")).find(
+        (candidate) => candidate.textContent.includes(label)
+    );
+    button?.click();
+    return !!button;
+}, timeoutMs)"""
+)
+
+_HAS_TEXT_RE = re.compile(r'^(?P<css>.+):has-text\("(?P<text>[^"]*)"\)$')
+
+# Which completion indicator of a standard response is present, or false while it streams.
+# Substantive message-content text counts once it has not changed for stableMs; the text
+# seen so far is kept on window between polls so the comparison never leaves the page.
+_RESPONSE_READY_JS = """(stableMs) => {
+    const visible = (el) => (el.checkVisibility ? el.checkVisibility() : el.getClientRects().length > 0);
+    const shown = (css, text = null) => Array.from(document.querySelectorAll(css)).some(
+        (el) => (text === null || el.textContent.includes(text)) && visible(el)
+    );
+    if (shown("button[data-testid='sources-button']") || shown("button", "Sources")) return "Sources button";
+    if (document.querySelector(".response-footer.complete") || shown(".message-actions button")
+        || shown("[data-testid='copy-button']")) return "Completion indicator";
+    const content = document.querySelector("message-content");
+    const text = content?.textContent.trim() ?? "";
+    if (text.length <= 50) return false;
+    const seen = window.__playpiResponse;
+    if (!seen || seen.content !== content || seen.text !== text) {
+        window.__playpiResponse = {content, text, since: performance.now()};
+        return false;
+    }
+    return performance.now() - seen.since >= stableMs && "Stable response content";
+}"""
+
+# Number of research plan steps and the current "Ready in ..." status line, if any
+_RESEARCH_PROGRESS_JS = """() => ({
+    steps: document.querySelectorAll('[data-test-id="research-steps"] .research-step').length,
+    status: document.body.innerText.match(/(?:Klaar over|Ready in|Done in)[^\\n]*/)?.[0] ?? null,
+})"""
+
+# Page state worth logging when a wait runs out, measured in-page in one round trip
+# rather than shipping the serialized document over CDP
+_PAGE_SNAPSHOT_JS = """() => ({
+    content_length: document.documentElement.outerHTML.length,
+    message_length: document.querySelector("message-content")?.textContent.length ?? 0,
+    sources_button: !!document.querySelector("button[data-testid='sources-button']"),
+    research_steps: document.querySelectorAll('[data-test-id="research-steps"] .research-step').length,
+})"""
+
+# Replaces the editor's content with the prompt as if typed; false if the browser refused
+_INSERT_PROMPT_JS = """(el, text) => {
+    el.focus();
+    document.execCommand("selectAll", false);
+    return document.execCommand("insertText", false, text);
+}"""
+
+# Inner HTML of the last match of the first selector whose last match is visible; null if none is
+_LAST_VISIBLE_HTML_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const elements = document.querySelectorAll(selector);
+        const last = elements[elements.length - 1];
+        if (last?.checkVisibility()) return [selector, last.innerHTML];
+    }
+    return null;
+}"""
+
+# Text of paragraph-like blocks that look like response content rather than UI chrome
+_SUBSTANTIVE_TEXT_BLOCKS_JS = """() => Array.from(
+    document.body.querySelectorAll("p, li, h1, h2, h3, h4, h5, h6, blockquote, pre"),
+    (block) => block.innerText.trim(),
+).filter((text) => text.length > 50 && !/^(http|www|@|#)/.test(text))"""
+
+# Title, link and snippet of every source card in the sources sidebar
+_SOURCE_CARDS_JS = """(sidebar) => Array.from(sidebar.querySelectorAll("inline-source-card"), (card) => ({
+    title: card.querySelector(".title")?.textContent ?? "",
+    url: card.querySelector("a")?.getAttribute("href") ?? "",
+    snippet: card.querySelector(".snippet")?.textContent ?? "",
+}))"""
 
 
 async def google_gemini_deep_research(
@@ -36,6 +257,7 @@ async def google_gemini_deep_research(
     timeout: int = 600,
     profile: str | None = None,
     verbose: bool = False,
+    session: PlayPiSession | None = None,
 ) -> str:
     """Perform Google Gemini Deep Research.
 
@@ -46,6 +268,9 @@ async def google_gemini_deep_research(
         timeout: Maximum wait time in seconds
         profile: Browser profile name for authentication (unused for now)
         verbose: Enable verbose logging
+        session: Already started session to run in, so consecutive calls share one
+            browser. The research borrows one of the session's pages and gives it
+            back afterwards. When omitted, a session is created for this call only.
 
     Returns:
         Research result as Markdown string
@@ -62,18 +287,15 @@ async def google_gemini_deep_research(
     if headless:
         logger.debug("playwrightauthor runs in headed mode; ignoring headless=True request")
 
-    profile_name = profile or os.environ.get("PLAYPI_PROFILE", "default")
-
-    config = PlayPiConfig(
-        headless=headless,
-        timeout=timeout * 1000,  # Convert to milliseconds for provider waits
-        verbose=verbose,
-        profile=profile_name,
-    )
+    config = _session_config({"headless": headless, "timeout": timeout, "verbose": verbose, "profile": profile})
 
     try:
-        async with create_session(config) as session:
-            page = await session.get_page()
+        if session is not None:
+            async with session.acquire_page() as page:
+                return await _google_gemini_deep_research_on_page(page, prompt, timeout=timeout)
+
+        async with create_session(config) as own_session:
+            page = await own_session.get_page()
             return await _google_gemini_deep_research_on_page(page, prompt, timeout=timeout)
 
     except PlaywrightTimeoutError as e:
@@ -85,6 +307,85 @@ async def google_gemini_deep_research(
         raise ProviderError(msg) from e
 
 
+class _GeminiOptions(TypedDict, total=False):
+    """Keyword options accepted by the ``**kwargs`` Gemini calls."""
+
+    headless: bool
+    timeout: int  # Seconds
+    verbose: bool
+    profile: str
+    download_path: str
+
+
+def _check_options(options: dict) -> None:
+    """Reject keyword options no Gemini call understands, e.g. a misspelt ``timeout``."""
+    unknown = options.keys() - _GeminiOptions.__annotations__.keys()
+    if unknown:
+        msg = f"Unexpected option(s): {', '.join(sorted(unknown))}"
+        raise TypeError(msg)
+
+
+def _session_config(options: _GeminiOptions) -> PlayPiConfig:
+    """Build the session config for one call from its public keyword options."""
+    return PlayPiConfig(
+        headless=options.get("headless", True),
+        timeout=options.get("timeout", 600) * 1000,  # Convert to milliseconds for provider waits
+        verbose=options.get("verbose", False),
+        profile=options.get("profile") or os.environ.get("PLAYPI_PROFILE", "default"),
+    )
+
+
+@contextlib.asynccontextmanager
+async def _gemini_page(
+    task: str, options: _GeminiOptions, *, session: PlayPiSession | None = None, url: str = GEMINI_APP_URL
+) -> AsyncIterator[Page]:
+    """Yield a Gemini page the user is logged in on.
+
+    Failures inside the block are reported the same way for every single-shot
+    Gemini call.
+
+    Args:
+        task: Name of the request, used in log and error messages
+        options: Keyword options of the public call (``timeout``, ``headless``, ...)
+        session: Already started session to borrow the page from; the page goes
+            back to the session afterwards. When omitted, a session is created for
+            this call only.
+        url: Gemini page to open
+
+    Raises:
+        PlayPiTimeoutError: If a Playwright wait runs out
+        ProviderError: For any other failure
+        TypeError: If ``options`` holds an unknown key
+    """
+    _check_options(options)
+    timeout_seconds = options.get("timeout", 600)
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(create_session(_session_config(options)))
+                page = await session.get_authenticated_page("google")
+            else:
+                page = await stack.enter_async_context(session.acquire_page())
+
+            # Navigate to Gemini
+            logger.info("🌐 Navigating to Gemini...")
+            await page.goto(url, timeout=30000)
+
+            # Ensure the user is authenticated before interacting with UI
+            logger.info("🔐 Checking authentication...")
+            await ensure_authenticated(page, timeout_seconds)
+
+            yield page
+
+    except PlaywrightTimeoutError as e:
+        msg = f"{task} timed out after {timeout_seconds} seconds"
+        raise PlayPiTimeoutError(msg) from e
+    except Exception as e:
+        logger.error(f"{task} failed: {e}")
+        msg = f"{task} failed: {e}"
+        raise ProviderError(msg) from e
+
+
 async def google_gemini_deep_research_full(
     prompt: str | None = None,
     prompt_path: str | pathlib.Path | None = None,
@@ -92,72 +393,258 @@ async def google_gemini_deep_research_full(
     **kwargs,
 ) -> str | pathlib.Path:
     """Perform Google Gemini Deep Research with full options."""
-    if prompt_path:
-        with open(prompt_path) as f:
-            prompt_from_file = f.read()
-        full_prompt = f"{prompt_from_file}\n{prompt}" if prompt else prompt_from_file
-    elif prompt:
-        full_prompt = prompt
-    else:
-        msg = "Either 'prompt' or 'prompt_path' must be provided."
-        raise ValueError(msg)
-
+    full_prompt = await _compose_prompt(prompt, prompt_path)
     result = await google_gemini_deep_research(full_prompt, **kwargs)
 
     if output_path:
-        with open(output_path, "w") as f:
-            f.write(result)
+        await asyncio.to_thread(pathlib.Path(output_path).write_text, result)
         return pathlib.Path(output_path)
     return result
 
 
-async def google_gemini_deep_research_multi(config: list[dict], **kwargs):
-    """Perform multiple Google Gemini Deep Research tasks concurrently."""
-    semaphore = asyncio.Semaphore(3)
+# Prompt file contents keyed by absolute path, with the mtime they were read at. While
+# a read is still running the entry holds its task, so concurrent jobs share that read.
+_PROMPT_CACHE: dict[str, tuple[int, str | asyncio.Task[str]]] = {}
 
-    async def run_task(session, task_config):
-        async with semaphore:
-            page = await session.new_page()
-            prompt = task_config.get("prompt")
-            prompt_path = task_config.get("prompt_path")
-            output_path = task_config.get("output_path")
 
-            if prompt_path:
-                with open(prompt_path) as f:
-                    prompt_from_file = f.read()
-                full_prompt = f"{prompt_from_file}\n{prompt}" if prompt else prompt_from_file
-            elif prompt:
-                full_prompt = prompt
-            else:
-                msg = "Either 'prompt' or 'prompt_path' must be provided."
-                raise ValueError(msg)
+def _stat_prompt(prompt_path: str | pathlib.Path) -> tuple[str, int]:
+    """Return the absolute path of a prompt file, used as its cache key, and its mtime."""
+    path = pathlib.Path(prompt_path).absolute()
+    return str(path), path.stat().st_mtime_ns
+
+
+async def _load_prompt(prompt_path: str | pathlib.Path) -> str:
+    """Read a prompt file off the event loop, reusing the text while its mtime is unchanged."""
+    path, mtime = await asyncio.to_thread(_stat_prompt, prompt_path)
+    cached = _PROMPT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        entry = cached[1]
+        if isinstance(entry, str):
+            return entry
+        if entry.get_loop() is asyncio.get_running_loop():
+            return await asyncio.shield(entry)
+
+    read = asyncio.ensure_future(asyncio.to_thread(pathlib.Path(path).read_text))
+    _PROMPT_CACHE[path] = (mtime, read)
+
+    def settle(task: asyncio.Task[str]) -> None:
+        if _PROMPT_CACHE.get(path) != (mtime, task):
+            return  # Superseded by a newer read
+        if task.cancelled() or task.exception() is not None:
+            del _PROMPT_CACHE[path]
+        else:
+            _PROMPT_CACHE[path] = (mtime, task.result())
+
+    read.add_done_callback(settle)
+    return await asyncio.shield(read)
+
+
+async def _compose_prompt(prompt: str | None, prompt_path: str | pathlib.Path | None) -> str:
+    """Combine the prompt file (read off the event loop) with the inline prompt."""
+    if prompt_path:
+        prompt_from_file = await _load_prompt(prompt_path)
+        return f"{prompt_from_file}\n{prompt}" if prompt else prompt_from_file
+    if prompt:
+        return prompt
+    msg = "Either 'prompt' or 'prompt_path' must be provided."
+    raise ValueError(msg)
+
+
+class DeepResearchJob(TypedDict, total=False):
+    """One job for `google_gemini_deep_research_multi` (``prompt`` and/or ``prompt_path``)."""
+
+    prompt: str
+    prompt_path: str
+    output_path: str
+
+
+async def google_gemini_deep_research_multi(
+    config: list[DeepResearchJob],
+    *,
+    max_concurrency: int | None = None,
+    qpm: int | None = None,
+    session: PlayPiSession | None = None,
+    return_exceptions: bool = False,
+    **kwargs,
+) -> list[str | pathlib.Path | Exception]:
+    """Perform multiple Google Gemini Deep Research tasks concurrently.
+
+    Args:
+        config: Job dictionaries with ``prompt``, ``prompt_path`` and/or ``output_path``.
+        max_concurrency: Maximum number of jobs running at once. Defaults to the
+            ``PLAYPI_CONCURRENCY`` environment variable, or 3 when it is unset.
+        qpm: Optional cap on job submissions per minute, to stay below Gemini rate limits.
+        session: Already started session to run the jobs in. When omitted, one
+            session is created for the whole batch and closed afterwards.
+        return_exceptions: Return a failed job's exception in its place and let
+            the other jobs finish, instead of raising it.
+        **kwargs: Session and research options forwarded to each job.
+
+    Returns:
+        One entry per job in input order: the Markdown result or the output path,
+        or with ``return_exceptions=True`` the exception raised by that job.
+
+    Raises:
+        TypeError: If ``kwargs`` holds an unknown option.
+        ValueError: If ``max_concurrency`` is below 1 or ``qpm`` is not positive.
+        Exception: The first failure of a job, unless ``return_exceptions`` is
+            set. The jobs still running are cancelled.
+    """
+    results: list[str | pathlib.Path | Exception | None] = [None] * len(config)
+    jobs = google_gemini_deep_research_stream(
+        config, max_concurrency=max_concurrency, qpm=qpm, session=session, **kwargs
+    )
+    async with contextlib.aclosing(jobs):
+        async for index, outcome in jobs:
+            if isinstance(outcome, Exception) and not return_exceptions:
+                raise outcome
+            results[index] = outcome
+    return results
+
+
+async def google_gemini_deep_research_stream(
+    config: list[DeepResearchJob],
+    *,
+    max_concurrency: int | None = None,
+    qpm: int | None = None,
+    session: PlayPiSession | None = None,
+    **kwargs,
+) -> AsyncIterator[tuple[int, str | pathlib.Path | Exception]]:
+    """Run Deep Research jobs like `google_gemini_deep_research_multi`, yielding each as it finishes.
 
-            result = await _google_gemini_deep_research_on_page(page, full_prompt, **kwargs)
+    Yields ``(index, outcome)`` pairs in completion order, where ``index`` is the
+    job's position in ``config`` and ``outcome`` is its result, output path, or
+    the exception it raised; a failed job does not stop the others. Finished reports can be
+    saved or processed while slower jobs are still running. Leaving the loop
+    early cancels the jobs still running; wrap the generator in
+    `contextlib.aclosing` to make that happen right away.
 
+    Arguments and errors are the same as for `google_gemini_deep_research_multi`.
+    """
+    _check_options(kwargs)
+    if max_concurrency is None:
+        max_concurrency = _concurrency_from_env()
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be at least 1, got {max_concurrency}."
+        raise ValueError(msg)
+    if qpm is not None and qpm <= 0:
+        msg = f"qpm must be a positive number of jobs per minute, got {qpm}."
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    throttle = _submission_throttle(qpm)
+    # Login state is per browser profile, so once one job has verified it the rest skip the check
+    authenticated = False
+
+    async def run_task(session, task_config):
+        nonlocal authenticated
+        async with semaphore:
+            await throttle()
+            full_prompt = await _compose_prompt(task_config.get("prompt"), task_config.get("prompt_path"))
+            # Finished jobs give their page back to the session, so the semaphore also
+            # keeps the number of pages opened for the batch at or below max_concurrency
+            async with session.acquire_page() as page:
+                try:
+                    result = await _google_gemini_deep_research_on_page(
+                        page, full_prompt, authenticated=authenticated, **kwargs
+                    )
+                except BaseException:
+                    authenticated = False  # The failure may be a lost login; re-check on the next job
+                    raise
+            authenticated = True
+
+            output_path = task_config.get("output_path")
             if output_path:
-                with open(output_path, "w") as f:
-                    f.write(result)
+                await asyncio.to_thread(pathlib.Path(output_path).write_text, result)
                 return pathlib.Path(output_path)
             return result
 
-    config_kwargs = dict(kwargs)
-    config_kwargs.setdefault("profile", os.environ.get("PLAYPI_PROFILE", "default"))
+    async def run_isolated(session, index, task_config):
+        # Hand a job's failure back as its outcome so the other jobs keep running
+        try:
+            return index, await run_task(session, task_config)
+        except Exception as e:
+            return index, e
+
+    async with contextlib.AsyncExitStack() as stack:
+        if session is None:
+            session = await stack.enter_async_context(create_session(_session_config(kwargs)))
+        tasks = [asyncio.create_task(run_isolated(session, index, job)) for index, job in enumerate(config)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _concurrency_from_env() -> int:
+    """Return the job limit from ``PLAYPI_CONCURRENCY``, or the default when it is unset."""
+    raw = os.environ.get("PLAYPI_CONCURRENCY", "").strip()
+    if not raw:
+        return DEFAULT_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        msg = f"PLAYPI_CONCURRENCY must be a whole number of at least 1, got {raw!r}."
+        raise ValueError(msg)
+    return value
+
+
+def _submission_throttle(qpm: int | None):
+    """Return an awaitable gate that spaces calls at most ``qpm`` per minute."""
+    if qpm is None:
+
+        async def unthrottled() -> None:
+            return None
+
+        return unthrottled
 
-    async with create_session(PlayPiConfig(**config_kwargs)) as session:
-        tasks = [run_task(session, task_config) for task_config in config]
-        return await asyncio.gather(*tasks)
+    interval = 60 / qpm
+    lock = asyncio.Lock()
+    next_slot = 0.0
 
+    async def throttled() -> None:
+        nonlocal next_slot
+        async with lock:
+            now = asyncio.get_running_loop().time()
+            if next_slot > now:
+                await asyncio.sleep(next_slot - now)
+                now = next_slot
+            next_slot = now + interval
 
-async def _google_gemini_deep_research_on_page(page: Page, prompt: str, **kwargs) -> str:
-    """Helper function to run deep research on a specific page."""
+    return throttled
+
+
+async def google_gemini_deep_research_batch(prompts: list[str], **kwargs) -> list[str]:
+    """Run several Deep Research prompts through one shared browser session.
+
+    Unlike calling `google_gemini_deep_research` once per prompt, this launches
+    the browser a single time and runs the prompts concurrently on separate pages
+    of the same context. Results are returned in the order of ``prompts``.
+    """
+    return await google_gemini_deep_research_multi([{"prompt": prompt} for prompt in prompts], **kwargs)
+
+
+async def _google_gemini_deep_research_on_page(
+    page: Page, prompt: str, *, authenticated: bool = False, **kwargs
+) -> str:
+    """Helper function to run deep research on a specific page.
+
+    ``authenticated=True`` skips the login check, for pages of a session where an
+    earlier job has already verified it.
+    """
     timeout = kwargs.get("timeout", 600)
     # Navigate to Gemini
     logger.info("🌐 Navigating to Gemini...")
-    await page.goto("https://gemini.google.com/u/0/app", timeout=30000)
+    await page.goto(GEMINI_APP_URL, timeout=30000)
 
     # Ensure the user is authenticated before interacting with UI
-    logger.info("🔐 Checking authentication...")
-    await ensure_authenticated(page, timeout)
+    if not authenticated:
+        logger.info("🔐 Checking authentication...")
+        await ensure_authenticated(page, timeout)
 
     # Enter the prompt
     logger.info("✏️ Entering research prompt...")
@@ -181,428 +668,300 @@ async def _google_gemini_deep_research_on_page(page: Page, prompt: str, **kwargs
 
     # Extract results
     logger.info("📄 Extracting research results...")
-    # Use fallback selectors to extract content
-    html_content = await async_extract_with_fallbacks(
-        page,
-        selectors=[
-            '[data-test-id="scroll-container"]',
-            ".research-content",
-            ".response-container",
-            'main [role="main"]',
-            "article",
-            "body",
-        ],
-        attribute="inner_html",
-    )
-    if not html_content:
-        logger.error("Failed to extract research content")
-        msg = "No content found in research results"
-        raise ProviderError(msg)
-    markdown_result = html_to_markdown(html_content)
+    markdown_result = await _extract_markdown_result(page, "research")
 
     logger.info("✅ Google Deep Research completed successfully!")
     return markdown_result
 
 
-async def google_gemini_generate_image(prompt: str, **kwargs):
-    """Generate an image using Google Gemini."""
-    verbose = kwargs.get("verbose", False)
-    _configure_logging(verbose)
-
-    logger.info(f"Starting Google Gemini Image Generation for: {prompt[:50]}...")
-
-    profile_name = kwargs.get("profile") or os.environ.get("PLAYPI_PROFILE", "default")
-
-    timeout_seconds = kwargs.get("timeout", 600)
-
-    config = PlayPiConfig(
-        headless=kwargs.get("headless", True),
-        timeout=timeout_seconds * 1000,  # Convert to milliseconds for provider waits
-        verbose=kwargs.get("verbose", False),
-        profile=profile_name,
-    )
+async def _extract_markdown_result(page: Page, label: str) -> str:
+    """Extract the finished response container and convert it to Markdown."""
+    html_content = await extract_research_content(page)
+    if not html_content:
+        logger.error(f"Failed to extract {label} content")
+        msg = f"No content found in {label} results"
+        raise ProviderError(msg)
+    return await asyncio.to_thread(html_to_markdown, html_content)
 
-    try:
-        async with create_session(config) as session:
-            page = await session.get_authenticated_page("google")
 
-            # Navigate to Gemini
-            logger.info("🌐 Navigating to Gemini...")
-            await page.goto("https://gemini.google.com/u/0/app", timeout=30000)
-
-            # Ensure the user is authenticated before interacting with UI
-            logger.info("🔐 Checking authentication...")
-            await ensure_authenticated(page, timeout_seconds)
+async def google_gemini_generate_image(prompt: str, *, session: PlayPiSession | None = None, **kwargs):
+    """Generate an image using Google Gemini.
 
-            # Activate Image Generation
-            logger.info("🎨 Activating Image Generation mode...")
-            await _activate_image_generation(page)
+    Pass an already started ``session`` to keep one browser warm across calls.
+    """
+    _configure_logging(kwargs.get("verbose", False))
 
-            # Enter the prompt
-            logger.info("✏️ Entering image prompt...")
-            await _enter_prompt(page, prompt)
+    logger.info(f"Starting Google Gemini Image Generation for: {prompt[:50]}...")
 
-            # Click send button
-            logger.info("📤 Submitting image request...")
-            await _click_send_button(page)
+    async with _gemini_page("Image Generation", kwargs, session=session) as page:
+        # Activate Image Generation
+        logger.info("🎨 Activating Image Generation mode...")
+        await _activate_image_generation(page)
 
-            # Wait for image to be generated
-            logger.info("🖼️ Image generation in progress...")
-            await _wait_for_image_generation(page, config.timeout)
+        # Enter the prompt
+        logger.info("✏️ Entering image prompt...")
+        await _enter_prompt(page, prompt)
 
-            # Download the image
-            logger.info("⬇️ Downloading generated image...")
-            download_path = kwargs.get("download_path", ".")
-            downloaded_image_path = await _download_generated_image(page, download_path)
+        # Click send button
+        logger.info("📤 Submitting image request...")
+        await _click_send_button(page)
 
-            logger.info(
-                f"✅ Google Gemini Image Generation completed successfully! Image saved to: {downloaded_image_path}"
-            )
-            return downloaded_image_path
+        # The download button only becomes clickable once the image is ready, so
+        # waiting on the download itself also waits for the generation
+        logger.info("🖼️ Image generation in progress...")
+        download_path = kwargs.get("download_path", ".")
+        timeout_ms = kwargs.get("timeout", 600) * 1000
+        downloaded_image_path = await _download_generated_image(page, download_path, timeout_ms)
 
-    except PlaywrightTimeoutError as e:
-        msg = f"Image generation timed out after {timeout_seconds} seconds"
-        raise PlayPiTimeoutError(msg) from e
-    except Exception as e:
-        logger.error(f"Google Gemini Image Generation failed: {e}")
-        msg = f"Image Generation failed: {e}"
-        raise ProviderError(msg) from e
+        logger.info(
+            f"✅ Google Gemini Image Generation completed successfully! Image saved to: {downloaded_image_path}"
+        )
+        return downloaded_image_path
 
 
 async def _activate_image_generation(page: Page) -> None:
     """Activate the Image Generation tool."""
     try:
-        logger.debug("Clicking Tools button to open toolbox")
-        tools_button = page.get_by_role("button", name="Tools")
-        await tools_button.wait_for(state="visible", timeout=10000)
-        await tools_button.click()
-
-        await asyncio.sleep(2)
+        await _open_toolbox(page)
 
         logger.debug("Looking for Image Generation button in dropdown")
-        image_gen_button = page.locator("button:has-text('Create images')").first
+        image_gen_button = page.locator(IMAGE_GENERATION_BUTTON_SELECTOR).first
         await image_gen_button.wait_for(state="visible", timeout=10000)
         await image_gen_button.click()
         logger.debug("Image Generation button clicked")
 
-        await asyncio.sleep(2)
+        await _wait_for_toolbox_closed(page)
 
     except Exception as e:
         msg = f"Failed to activate Image Generation: {e}"
         raise ProviderError(msg) from e
 
 
-async def _wait_for_image_generation(page: Page, timeout: int) -> None:
-    """Wait for the image to be generated."""
-    try:
-        download_button = page.locator('[data-test-id="download-generated-image-button"]')
-        await download_button.wait_for(state="visible", timeout=timeout)
-    except Exception as e:
-        msg = f"Failed to wait for image generation: {e}"
-        raise ProviderError(msg) from e
-
-
-async def _download_generated_image(page: Page, download_path: str) -> str:
-    """Download the generated image."""
-    downloads_dir = str(pathlib.Path.home() / "Downloads")
-    # Get list of files before download
-    files_before = os.listdir(downloads_dir)
-
-    download_button = page.locator('[data-test-id="download-generated-image-button"]').first
-    await download_button.click()
-
-    # Wait for a short period to allow the download to complete
-    await asyncio.sleep(5)
-
-    # Get list of files after download
-    files_after = os.listdir(downloads_dir)
+async def _download_generated_image(page: Page, download_path: str, timeout: int) -> str:
+    """Download the generated image once Gemini offers it.
 
-    # Find the new file
-    new_files = [f for f in files_after if f not in files_before]
-    if not new_files:
-        msg = "Could not find downloaded image."
-        raise ProviderError(msg)
-
-    newest_file = max([os.path.join(downloads_dir, f) for f in new_files], key=os.path.getctime)
+    Args:
+        page: Gemini page the image is being generated on.
+        download_path: Directory to save the image in (created if missing).
+        timeout: Milliseconds to wait for the image to become downloadable.
+    """
+    download_button = page.locator(DOWNLOAD_IMAGE_BUTTON_SELECTOR).first
+    async with page.expect_download(timeout=timeout) as download_info:
+        await download_button.click(timeout=timeout)
+    download = await download_info.value
+    logger.info("⬇️ Downloading generated image...")
 
-    # Move the file to the destination
-    destination_path = os.path.join(download_path, os.path.basename(newest_file))
-    shutil.move(newest_file, destination_path)
+    await asyncio.to_thread(os.makedirs, download_path, exist_ok=True)
+    destination_path = os.path.join(download_path, download.suggested_filename)
+    await download.save_as(destination_path)
 
     return destination_path
 
 
-async def google_gemini_ask_deep_think(prompt: str, **kwargs):
-    """Perform a deep think using Google Gemini."""
-    verbose = kwargs.get("verbose", False)
-    _configure_logging(verbose)
+async def google_gemini_ask_deep_think(prompt: str, *, session: PlayPiSession | None = None, **kwargs):
+    """Perform a deep think using Google Gemini.
 
-    logger.info(f"Starting Google Gemini Deep Think for: {prompt[:50]}...")
-
-    profile_name = kwargs.get("profile") or os.environ.get("PLAYPI_PROFILE", "default")
-
-    timeout_seconds = kwargs.get("timeout", 600)
+    Pass an already started ``session`` to keep one browser warm across calls.
+    """
+    _configure_logging(kwargs.get("verbose", False))
 
-    config = PlayPiConfig(
-        headless=kwargs.get("headless", True),
-        timeout=timeout_seconds * 1000,  # Convert to milliseconds for provider waits
-        verbose=kwargs.get("verbose", False),
-        profile=profile_name,
-    )
+    logger.info(f"Starting Google Gemini Deep Think for: {prompt[:50]}...")
 
-    try:
-        async with create_session(config) as session:
-            page = await session.get_authenticated_page("google")
+    async with _gemini_page("Deep Think", kwargs, session=session) as page:
+        # Activate Deep Think
+        logger.info("🤔 Activating Deep Think mode...")
+        await _activate_deep_think(page)
 
-            # Navigate to Gemini
-            logger.info("🌐 Navigating to Gemini...")
-            await page.goto("https://gemini.google.com/u/0/app", timeout=30000)
+        # Enter the prompt
+        logger.info("✏️ Entering deep think prompt...")
+        await _enter_prompt(page, prompt)
 
-            # Ensure the user is authenticated before interacting with UI
-            logger.info("🔐 Checking authentication...")
-            await ensure_authenticated(page, timeout_seconds)
+        # Click send button
+        logger.info("📤 Submitting deep think request...")
+        await _click_send_button(page)
 
-            # Activate Deep Think
-            logger.info("🤔 Activating Deep Think mode...")
-            await _activate_deep_think(page)
-
-            # Enter the prompt
-            logger.info("✏️ Entering deep think prompt...")
-            await _enter_prompt(page, prompt)
-
-            # Click send button
-            logger.info("📤 Submitting deep think request...")
-            await _click_send_button(page)
-
-            # Wait for completion
-            logger.info("🤔 Deep Think in progress...")
-            await _wait_for_completion(page, timeout_seconds)
-
-            # Extract results
-            logger.info("📄 Extracting deep think results...")
-            # Use fallback selectors to extract content
-            html_content = await async_extract_with_fallbacks(
-                page,
-                selectors=[
-                    '[data-test-id="scroll-container"]',
-                    ".research-content",
-                    ".response-container",
-                    'main [role="main"]',
-                    "article",
-                    "body",
-                ],
-                attribute="inner_html",
-            )
-            if not html_content:
-                logger.error("Failed to extract deep think content")
-                msg = "No content found in deep think results"
-                raise ProviderError(msg)
-            markdown_result = html_to_markdown(html_content)
+        # Wait for completion
+        logger.info("🤔 Deep Think in progress...")
+        await _wait_for_completion(page, kwargs.get("timeout", 600))
 
-            logger.info("✅ Google Gemini Deep Think completed successfully!")
-            return markdown_result
+        # Extract results
+        logger.info("📄 Extracting deep think results...")
+        markdown_result = await _extract_markdown_result(page, "deep think")
 
-    except PlaywrightTimeoutError as e:
-        msg = f"Deep think timed out after {timeout_seconds} seconds"
-        raise PlayPiTimeoutError(msg) from e
-    except Exception as e:
-        logger.error(f"Google Gemini Deep Think failed: {e}")
-        msg = f"Deep Think failed: {e}"
-        raise ProviderError(msg) from e
+        logger.info("✅ Google Gemini Deep Think completed successfully!")
+        return markdown_result
 
 
 async def _activate_deep_think(page: Page) -> None:
     """Activate the Deep Think tool."""
     try:
-        logger.debug("Clicking Tools button to open toolbox")
-        tools_button = page.get_by_role("button", name="Tools")
-        await tools_button.wait_for(state="visible", timeout=10000)
-        await tools_button.click()
-
-        await asyncio.sleep(2)
+        await _open_toolbox(page)
 
         logger.debug("Looking for Deep Think button in dropdown")
-        deep_think_button = page.locator("button:has-text('Deep Think')").first
+        deep_think_button = page.locator(DEEP_THINK_BUTTON_SELECTOR).first
         await deep_think_button.wait_for(state="visible", timeout=10000)
         await deep_think_button.click()
         logger.debug("Deep Think button clicked")
 
-        await asyncio.sleep(2)
+        await _wait_for_toolbox_closed(page)
 
     except Exception as e:
         msg = f"Failed to activate Deep Think: {e}"
         raise ProviderError(msg) from e
 
 
-async def google_gemini_ask(prompt: str, **kwargs):
-    """Ask a simple question to Google Gemini."""
-    verbose = kwargs.get("verbose", False)
-    _configure_logging(verbose)
+async def _open_toolbox(page: Page) -> None:
+    """Click the Tools button so the drawer listing Gemini's tools opens."""
+    logger.debug("Clicking Tools button to open toolbox")
+    tools_button = page.get_by_role("button", name=TOOLS_BUTTON_NAME)
+    await tools_button.wait_for(state="visible", timeout=10000)
+    await tools_button.click()
 
-    logger.info(f"Asking Gemini: {prompt[:50]}...")
 
-    profile_name = kwargs.get("profile") or os.environ.get("PLAYPI_PROFILE", "default")
+async def _wait_for_toolbox_closed(page: Page) -> None:
+    """Wait for the Tools drawer to close once a tool has been picked from it.
 
-    timeout_seconds = kwargs.get("timeout", 600)
+    Waits on the drawer itself: the tool's label reappears on the selected-tool
+    chip, so the tool button text is not a reliable signal.
+    """
+    try:
+        await page.locator(TOOLBOX_DRAWER_SELECTOR).wait_for(state="hidden", timeout=5000)
+    except PlaywrightTimeoutError:
+        logger.debug("Tools drawer still open after selecting a tool")
 
-    config = PlayPiConfig(
-        headless=kwargs.get("headless", True),
-        timeout=timeout_seconds * 1000,  # Convert to milliseconds for provider waits
-        verbose=kwargs.get("verbose", False),
-        profile=profile_name,
-    )
 
-    try:
-        async with create_session(config) as session:
-            page = await session.get_authenticated_page("google")
+async def google_gemini_ask(prompt: str, *, session: PlayPiSession | None = None, **kwargs):
+    """Ask a simple question to Google Gemini.
 
-            # Navigate to Gemini
-            logger.info("🌐 Navigating to Gemini...")
-            await page.goto("https://gemini.google.com/app", timeout=30000)
+    Pass an already started ``session`` to keep one browser warm across calls.
+    """
+    _configure_logging(kwargs.get("verbose", False))
 
-            # Ensure the user is authenticated before interacting with UI
-            logger.info("🔐 Checking authentication...")
-            await ensure_authenticated(page, timeout_seconds)
+    logger.info(f"Asking Gemini: {prompt[:50]}...")
 
-            # Enter the prompt
-            logger.info("✏️ Entering prompt...")
-            await _enter_prompt(page, prompt)
+    async with _gemini_page("Gemini request", kwargs, session=session, url="https://gemini.google.com/app") as page:
+        # Enter the prompt
+        logger.info("✏️ Entering prompt...")
+        await _enter_prompt(page, prompt)
 
-            # Click send button
-            logger.info("📤 Submitting prompt...")
-            await _click_send_button(page)
+        # Click send button
+        logger.info("📤 Submitting prompt...")
+        await _click_send_button(page)
 
-            # Wait for completion of the standard response (non Deep Research)
-            logger.info("🤔 Waiting for response...")
-            await _wait_for_sources_button(page, timeout_seconds)
+        # Wait for completion of the standard response (non Deep Research)
+        logger.info("🤔 Waiting for response...")
+        await _wait_for_sources_button(page, kwargs.get("timeout", 600))
 
-            # Extract results with enhanced format
-            logger.info("📄 Extracting response...")
-            markdown_result = await _extract_enhanced_response(page)
+        # Extract results with enhanced format
+        logger.info("📄 Extracting response...")
+        markdown_result = await _extract_enhanced_response(page)
 
-            logger.info("✅ Gemini responded successfully!")
-            return markdown_result
+        logger.info("✅ Gemini responded successfully!")
+        return markdown_result
 
-    except PlaywrightTimeoutError as e:
-        msg = f"Gemini timed out after {timeout_seconds} seconds"
-        raise PlayPiTimeoutError(msg) from e
-    except Exception as e:
-        logger.error(f"Gemini request failed: {e}")
-        msg = f"Gemini request failed: {e}"
-        raise ProviderError(msg) from e
 
+async def _wait_for_any(page: Page, selectors: tuple[str, ...], *, timeout: int, last: bool = False) -> Locator | None:
+    """Wait once for any of ``selectors`` and return the highest-priority visible match.
 
-async def _extract_simple_response(page: Page) -> str:
-    """Extract the simple response from the page."""
+    A single wait on the CSS union bounds the miss case to ``timeout`` instead of
+    one timeout per selector. Returns None when nothing became visible in time.
+    """
+    union = page.locator(", ".join(selectors))
     try:
-        # Try multiple selectors for the response content
-        selectors = [
-            "message-content",  # Current Gemini UI
-            "response-element",  # Legacy selector
-            ".model-response-text",  # Alternative selector
-            ".markdown.markdown-main-panel",  # Content within message-content
-        ]
-
-        response_element = None
-        for selector in selectors:
-            try:
-                element = page.locator(selector).last
-                await element.wait_for(state="visible", timeout=5000)
-                logger.debug(f"Found response content using selector: {selector}")
-                response_element = element
-                break
-            except PlaywrightTimeoutError:
-                logger.debug(f"Selector '{selector}' not found or timed out")
-                continue
+        await (union.last if last else union.first).wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.debug(f"None of the selectors became visible: {selectors}")
+        return None
 
-        if response_element is None:
-            # Log the current page HTML for debugging and save it for analysis
-            page_html = await page.content()
-            logger.debug(f"Page HTML length: {len(page_html)}")
+    for selector in selectors:
+        element = page.locator(selector).last if last else page.locator(selector).first
+        if await element.is_visible():
+            logger.debug(f"Found element using selector: {selector}")
+            return element
+    return union.last if last else union.first
 
-            # Save the full HTML to a debug file for analysis
-            import os
 
-            debug_dir = os.path.expanduser("~/tmp")
-            os.makedirs(debug_dir, exist_ok=True)
-            debug_file = os.path.join(debug_dir, "gemini_response_debug.html")
-            with open(debug_file, "w", encoding="utf-8") as f:
-                f.write(page_html)
-            logger.debug(f"Saved page HTML to: {debug_file}")
+async def _extract_simple_response(page: Page) -> str:
+    """Extract the simple response from the page."""
+    try:
+        try:
+            await page.locator(", ".join(RESPONSE_SELECTORS)).last.wait_for(state="visible", timeout=5000)
+            # Pick the response and read its HTML in one round trip
+            match = await page.evaluate(_LAST_VISIBLE_HTML_JS, list(RESPONSE_SELECTORS))
+        except PlaywrightTimeoutError:
+            logger.debug(f"None of the selectors became visible: {RESPONSE_SELECTORS}")
+            match = None
 
-            # After saving, also add the content to the error message for analysis
-            logger.error(f"Here's the HTML of the finished response: \n\n```\n{page_html}\n```")
+        if match is None:
+            if _verbose_sink_id is not None:
+                await _dump_debug_html(page)
 
-            # Another fallback: try to get any visible text content from the page
+            # Another fallback: collect substantive paragraphs with the browser's own parser
             try:
-                # Get all text from the page and see if we can extract meaningful content
-                page_text = await page.locator("body").text_content()
-                if page_text and len(page_text) > 500:
-                    logger.debug("Attempting to extract response from page text content")
-                    # Look for content that looks like a proper response
-                    lines = page_text.split("\n")
-                    content_lines = []
-                    in_response = False
-
-                    for line in lines:
-                        line = line.strip()
-                        # Skip navigation and UI elements
-                        if line in ["", "Chat", "Apps", "More", "Sources", "Gemini", "Google", "Bard"]:
-                            continue
-                        # Look for substantive content
-                        if len(line) > 50 and not line.startswith(("http", "www", "@", "#")):
-                            content_lines.append(line)
-                            in_response = True
-                        elif in_response and len(line) > 20:
-                            content_lines.append(line)
-
-                    if content_lines:
-                        logger.debug(f"Extracted {len(content_lines)} content lines from page text")
-                        return "\n\n".join(content_lines)
+                content_blocks = await page.evaluate(_SUBSTANTIVE_TEXT_BLOCKS_JS)
+                if content_blocks:
+                    logger.debug(f"Extracted {len(content_blocks)} content blocks from page text")
+                    return "\n\n".join(content_blocks)
             except Exception as text_extract_error:
                 logger.debug(f"Failed to extract from page text: {text_extract_error}")
 
             msg = "No response content found using any selector or fallback method"
             raise ProviderError(msg)
 
-        html_content = await response_element.inner_html()
-        logger.debug(f"Extracted HTML content length: {len(html_content)}")
-        return html_to_markdown(html_content)
+        selector, html_content = match
+        logger.debug(f"Extracted {len(html_content)} characters of HTML using selector: {selector}")
+        return await asyncio.to_thread(html_to_markdown, html_content)
 
     except Exception as e:
-        # Log additional debug info about the page state
-        try:
-            page_title = await page.title()
-            page_url = page.url
-            logger.debug(f"Page state - Title: '{page_title}', URL: '{page_url}'")
-
-            # Check if there's an error message on the page
-            error_elements = page.locator(".error, .warning, [class*='error'], [class*='warning']")
-            error_count = await error_elements.count()
-            if error_count > 0:
-                for i in range(min(error_count, 3)):  # Check first 3 error elements
-                    error_text = await error_elements.nth(i).text_content()
-                    logger.debug(f"Error element {i}: {error_text}")
-        except Exception:
-            pass  # Debug logging shouldn't fail the main operation
+        # Log additional debug info about the page state, only if the output is shown
+        if _verbose_sink_id is not None:
+            with contextlib.suppress(Exception):  # Debug logging shouldn't fail the main operation
+                await _log_page_state(page)
 
         msg = f"Failed to extract simple response: {e}"
         raise ProviderError(msg) from e
 
 
+async def _log_page_state(page: Page) -> None:
+    """Log the page title, URL and the first error messages shown on the page."""
+    page_title = await page.title()
+    logger.debug(f"Page state - Title: '{page_title}', URL: '{page.url}'")
+
+    # Check if there's an error message on the page
+    error_elements = page.locator(".error, .warning, [class*='error'], [class*='warning']")
+    error_count = await error_elements.count()
+    for i in range(min(error_count, 3)):  # Check first 3 error elements
+        error_text = await error_elements.nth(i).text_content()
+        logger.debug(f"Error element {i}: {error_text}")
+
+
+async def _dump_debug_html(page: Page) -> None:
+    """Save the page HTML to ``~/tmp`` so a failed extraction can be analysed later."""
+    page_html = await page.content()
+
+    def write() -> pathlib.Path:
+        debug_file = pathlib.Path("~/tmp/gemini_response_debug.html").expanduser()
+        debug_file.parent.mkdir(parents=True, exist_ok=True)
+        debug_file.write_text(page_html, encoding="utf-8")
+        return debug_file
+
+    debug_file = await asyncio.to_thread(write)
+    logger.error(f"No response element found; saved {len(page_html)} characters of page HTML to: {debug_file}")
+
+
 async def _extract_enhanced_response(page: Page) -> str:
     """Extract the enhanced response with thinking, output, and sources."""
     try:
         logger.debug("Starting enhanced response extraction")
 
-        # First extract the main output
-        output_content = await _extract_main_output(page)
-
-        # Try to extract thinking content
-        thinking_content = await _extract_thinking_content(page)
-
-        # Try to extract sources content
-        sources_content = await _extract_sources_content(page)
+        # The Sources sidebar is independent of the message, so read it alongside the
+        # main output and thinking; those two stay ordered because expanding thinking
+        # changes the message DOM the main output is read from
+        async with asyncio.TaskGroup() as group:
+            message_task = group.create_task(_extract_message_content(page))
+            sources_task = group.create_task(_extract_sources_content(page))
+        output_content, thinking_content = message_task.result()
+        sources_content = sources_task.result()
 
         # Format the final response
         result_parts = []
@@ -628,26 +987,20 @@ async def _extract_enhanced_response(page: Page) -> str:
         return await _extract_simple_response(page)
 
 
+async def _extract_message_content(page: Page) -> tuple[str, str]:
+    """Extract the main output, then the thinking content, of the last response."""
+    output_content = await _extract_main_output(page)
+    thinking_content = await _extract_thinking_content(page)
+    return output_content, thinking_content
+
+
 async def _extract_main_output(page: Page) -> str:
     """Extract the main response output."""
     try:
-        # Try multiple selectors for the response content
-        selectors = [
-            "message-content.model-response-text",  # Current Gemini UI with thinking
-            "message-content",  # Current Gemini UI
-            ".model-response-text",  # Alternative selector
-            ".markdown.markdown-main-panel",  # Content within message-content
-        ]
-
-        for selector in selectors:
-            try:
-                element = page.locator(selector).last
-                await element.wait_for(state="visible", timeout=3000)
-                logger.debug(f"Found main output using selector: {selector}")
-                html_content = await element.inner_html()
-                return html_to_markdown(html_content)
-            except PlaywrightTimeoutError:
-                continue
+        element = await _wait_for_any(page, MAIN_OUTPUT_SELECTORS, timeout=3000, last=True)
+        if element is not None:
+            html_content = await element.inner_html()
+            return await asyncio.to_thread(html_to_markdown, html_content)
 
         # If no specific selector works, fall back to simple extraction logic
         return await _extract_simple_response(page)
@@ -663,10 +1016,10 @@ async def _extract_thinking_content(page: Page) -> str:
         logger.debug("Looking for Show thinking button")
 
         # Look for the Show thinking button
-        thinking_button = page.locator('[data-test-id="thoughts-header-button"]')
+        thinking_button = page.locator(THINKING_BUTTON_SELECTOR).first
 
         # Check if button exists and is visible
-        if await thinking_button.count() == 0:
+        if not await thinking_button.is_visible():
             logger.debug("No Show thinking button found")
             return ""
 
@@ -675,22 +1028,20 @@ async def _extract_thinking_content(page: Page) -> str:
         if button_text and "show thinking" in button_text.lower():
             logger.debug("Clicking Show thinking button")
             await thinking_button.click()
-            # Wait a moment for the content to expand
-            await asyncio.sleep(2)
         else:
             logger.debug("Thinking appears to already be expanded")
 
-        # Extract the thinking content
-        thinking_content_selector = '[data-test-id="thoughts-content"]'
-        thinking_element = page.locator(thinking_content_selector)
-
-        if await thinking_element.count() > 0:
+        # Wait for the expanded content itself rather than a fixed delay
+        thinking_element = page.locator(THINKING_CONTENT_SELECTOR)
+        try:
             await thinking_element.wait_for(state="visible", timeout=5000)
-            html_content = await thinking_element.inner_html()
-            logger.debug(f"Extracted thinking content length: {len(html_content)}")
-            return html_to_markdown(html_content)
-        logger.debug("No thinking content found after clicking button")
-        return ""
+        except PlaywrightTimeoutError:
+            logger.debug("No thinking content found after clicking button")
+            return ""
+
+        html_content = await thinking_element.inner_html()
+        logger.debug(f"Extracted thinking content length: {len(html_content)}")
+        return await asyncio.to_thread(html_to_markdown, html_content)
 
     except Exception as e:
         logger.debug(f"Failed to extract thinking content: {e}")
@@ -703,10 +1054,10 @@ async def _extract_sources_content(page: Page) -> str:
         logger.debug("Looking for Sources button")
 
         # Look for the Sources button in the sources list
-        sources_button = page.locator('button:has-text("Sources")')
+        sources_button = page.locator(SOURCES_BUTTON_SELECTOR).first
 
         # Check if button exists and is visible
-        if await sources_button.count() == 0:
+        if not await sources_button.is_visible():
             logger.debug("No Sources button found")
             return ""
 
@@ -714,54 +1065,36 @@ async def _extract_sources_content(page: Page) -> str:
         await sources_button.click()
 
         # Wait for the sources sidebar to appear
-        await asyncio.sleep(2)
-
-        # Extract the sources content from the sidebar
-        sources_sidebar = page.locator("context-sidebar")
-        if await sources_sidebar.count() > 0:
+        sources_sidebar = page.locator(SOURCES_SIDEBAR_SELECTOR)
+        try:
             await sources_sidebar.wait_for(state="visible", timeout=5000)
+        except PlaywrightTimeoutError:
+            logger.debug("No sources sidebar found after clicking button")
+            return ""
 
-            # Look for individual source cards
-            source_cards = sources_sidebar.locator("inline-source-card")
-            sources_count = await source_cards.count()
-
-            if sources_count > 0:
-                logger.debug(f"Found {sources_count} source cards")
-                sources_list = []
-
-                for i in range(sources_count):
-                    try:
-                        card = source_cards.nth(i)
-                        # Extract title and URL
-                        title_element = card.locator(".title")
-                        title = await title_element.text_content() if await title_element.count() > 0 else ""
-
-                        link_element = card.locator("a")
-                        url = await link_element.get_attribute("href") if await link_element.count() > 0 else ""
-
-                        snippet_element = card.locator(".snippet")
-                        snippet = await snippet_element.text_content() if await snippet_element.count() > 0 else ""
-
-                        if title and url:
-                            source_entry = (
-                                f"**{title.strip()}**\n{url}\n{snippet.strip()}"
-                                if snippet
-                                else f"**{title.strip()}**\n{url}"
-                            )
-                            sources_list.append(source_entry)
-                    except Exception as card_error:
-                        logger.debug(f"Failed to extract source card {i}: {card_error}")
-                        continue
-
-                if sources_list:
-                    return "\n\n".join(sources_list)
-
-            # Fallback: get all text content from sidebar
-            html_content = await sources_sidebar.inner_html()
-            logger.debug(f"Extracted sources sidebar HTML length: {len(html_content)}")
-            return html_to_markdown(html_content)
-        logger.debug("No sources sidebar found after clicking button")
-        return ""
+        # Read every source card in one round trip instead of several per card
+        try:
+            cards = await sources_sidebar.evaluate(_SOURCE_CARDS_JS)
+        except Exception as cards_error:
+            logger.debug(f"Failed to read source cards: {cards_error}")
+            cards = []
+
+        if cards:
+            logger.debug(f"Found {len(cards)} source cards")
+            sources_list = [
+                f"**{card['title'].strip()}**\n{card['url']}\n{card['snippet'].strip()}"
+                if card["snippet"]
+                else f"**{card['title'].strip()}**\n{card['url']}"
+                for card in cards
+                if card["title"] and card["url"]
+            ]
+            if sources_list:
+                return "\n\n".join(sources_list)
+
+        # Fallback: get all text content from sidebar
+        html_content = await sources_sidebar.inner_html()
+        logger.debug(f"Extracted sources sidebar HTML length: {len(html_content)}")
+        return await asyncio.to_thread(html_to_markdown, html_content)
 
     except Exception as e:
         logger.debug(f"Failed to extract sources content: {e}")
@@ -773,23 +1106,7 @@ async def _enter_prompt(page: Page, prompt: str) -> None:
     try:
         logger.debug("Looking for prompt input field")
 
-        # Try multiple selectors for the text input to be more robust
-        text_input = None
-        selectors = [
-            'role=textbox[name="Enter a prompt here"]',
-            '[role="textbox"]',
-            ".text-input-field_textarea .ql-editor",
-            "rich-textarea .ql-editor",
-        ]
-
-        for selector in selectors:
-            try:
-                text_input = page.locator(selector).first
-                await text_input.wait_for(state="visible", timeout=5000)
-                logger.debug(f"Found text input using selector: {selector}")
-                break
-            except PlaywrightTimeoutError:
-                continue
+        text_input = await _wait_for_any(page, PROMPT_INPUT_SELECTORS, timeout=5000)
 
         if text_input is None:
             # Fallback to role-based selector with longer timeout
@@ -797,10 +1114,18 @@ async def _enter_prompt(page: Page, prompt: str) -> None:
             await text_input.wait_for(state="visible", timeout=10000)
             logger.debug("Found text input using role-based selector")
 
-        # Click and fill immediately
-        logger.debug("Clicking text input and entering prompt")
-        await text_input.click()
-        await text_input.fill(prompt)
+        # Focus, clear and insert in one round trip; insertText goes through the
+        # editor's normal input handling, so Quill keeps its model in sync
+        logger.debug("Entering prompt")
+        inserted = False
+        try:
+            inserted = await text_input.evaluate(_INSERT_PROMPT_JS, prompt)
+        except Exception as e:
+            logger.debug(f"In-page prompt entry failed: {e}")
+        if not inserted:
+            logger.debug("Falling back to clicking and filling the text input")
+            await text_input.click()
+            await text_input.fill(prompt)
 
         logger.debug(f"Prompt entered successfully: {prompt[:100]}...")
 
@@ -812,62 +1137,26 @@ async def _enter_prompt(page: Page, prompt: str) -> None:
 async def _activate_deep_research(page: Page) -> None:
     """Activate the Deep Research tool."""
     try:
-        logger.debug("Clicking Tools button to open toolbox")
-        # Click the Tools button
-        tools_button = page.get_by_role("button", name="Tools")
-        await tools_button.wait_for(state="visible", timeout=10000)
-        await tools_button.click()
-
-        # Wait for the dropdown to appear
-        await asyncio.sleep(2)
-
-        logger.debug("Looking for Deep Research button in dropdown")
-        # First try the specific CSS selector you provided
-        deep_research_button = page.locator(
-            "#cdk-overlay-0 > mat-card > mat-action-list > toolbox-drawer-item:nth-child(1) > button"
-        )
+        await _open_toolbox(page)
 
-        # Check if this is actually the Deep Research button
+        # Find and click the tool in the same round trip that waits for the drawer to render
         try:
-            await deep_research_button.wait_for(state="visible", timeout=5000)
-            button_text = await deep_research_button.text_content()
-            logger.debug(f"First button text: '{button_text}'")
-
-            if not button_text or "Deep Research" not in button_text:
-                logger.debug("First button is not Deep Research, searching within overlay")
-                # Find Deep Research button within the overlay
-                overlay = page.locator("#cdk-overlay-0 > mat-card")
-                deep_research_button = overlay.locator("toolbox-drawer-item button:has-text('Deep Research')").first
-
-        except Exception:
-            logger.debug("Direct selector failed, using overlay search")
-            # Fallback: find Deep Research button within the overlay
-            overlay = page.locator("#cdk-overlay-0 > mat-card")
-            deep_research_button = overlay.locator("toolbox-drawer-item button:has-text('Deep Research')").first
-
-        # Wait for it to be visible and clickable
-        await deep_research_button.wait_for(state="visible", timeout=10000)
-        logger.debug("Deep Research button found and visible")
-
-        # Click the Deep Research button
-        await deep_research_button.click()
-        logger.debug("Deep Research button clicked")
+            clicked = await page.evaluate(_CLICK_DRAWER_TOOL_JS, ["Deep Research", 10_000])
+        except Exception as e:
+            logger.debug(f"In-page Deep Research click failed: {e}")
+            clicked = False
 
-        # Wait a moment for the selection to take effect
-        await asyncio.sleep(2)
+        if clicked:
+            logger.debug("Deep Research button clicked")
+        else:
+            await _click_deep_research_button(page)
 
-        # Check if Deep Research is now selected by looking for the deselect button
+        # Proceed as soon as the page reflects the selection
         try:
-            deselect_button = page.locator('button[aria-label*="Deselect Deep Research"]')
-            if await deselect_button.count() > 0:
-                logger.debug("Deep Research successfully activated (deselect button found)")
+            if await page.evaluate(_AWAIT_DEEP_RESEARCH_ACTIVE_JS, 5000):
+                logger.debug("Deep Research successfully activated")
             else:
-                # Alternative check - look for the toolbox showing Deep Research as selected
-                selected_indicator = page.locator("toolbox-drawer").locator(':has-text("Deep Research")')
-                if await selected_indicator.count() > 0:
-                    logger.debug("Deep Research appears to be selected")
-                else:
-                    logger.warning("Could not confirm Deep Research activation, but continuing")
+                logger.warning("Could not confirm Deep Research activation, but continuing")
         except Exception as e:
             logger.debug(f"Could not verify Deep Research activation: {e}, continuing anyway")
 
@@ -878,20 +1167,51 @@ async def _activate_deep_research(page: Page) -> None:
         raise ProviderError(msg) from e
 
 
+async def _click_deep_research_button(page: Page) -> None:
+    """Locate the Deep Research button in the open Tools drawer and click it."""
+    overlay = page.locator(TOOLBOX_DRAWER_SELECTOR)
+    labelled_button = overlay.locator("toolbox-drawer-item button:has-text('Deep Research')").first
+
+    # Wait for the toolbox drawer overlay to render instead of sleeping blindly
+    await overlay.wait_for(state="visible", timeout=10000)
+
+    logger.debug("Looking for Deep Research button in dropdown")
+    # First try the specific CSS selector you provided
+    deep_research_button = overlay.locator("mat-action-list > toolbox-drawer-item:nth-child(1) > button")
+
+    # Check if this is actually the Deep Research button
+    try:
+        await deep_research_button.wait_for(state="visible", timeout=5000)
+        button_text = await deep_research_button.text_content()
+        logger.debug(f"First button text: '{button_text}'")
+
+        if not button_text or "Deep Research" not in button_text:
+            logger.debug("First button is not Deep Research, searching within overlay")
+            deep_research_button = labelled_button
+
+    except Exception:
+        logger.debug("Direct selector failed, using overlay search")
+        deep_research_button = labelled_button
+
+    # Wait for it to be visible and clickable
+    await deep_research_button.wait_for(state="visible", timeout=10000)
+    logger.debug("Deep Research button found and visible")
+
+    # Click the Deep Research button
+    await deep_research_button.click()
+    logger.debug("Deep Research button clicked")
+
+
 async def _click_send_button(page: Page) -> None:
     """Click the send button to submit the research query."""
     try:
         logger.debug("Looking for send button")
-        # Look for send button inside .send-button-container or use the role-based selector
-        send_button = page.locator('.send-button-container button[data-test-id="send-button"]')
-
-        if await send_button.count() == 0:
-            # Fallback to role-based selector
-            send_button = page.get_by_role("button", name="Send message")
+        # The send button inside .send-button-container, or the role-based match as a fallback
+        send_button = page.locator(SEND_BUTTON_SELECTOR).or_(page.get_by_role("button", name="Send message")).first
 
-        await send_button.wait_for(state="visible", timeout=10000)
         logger.debug("Clicking send button")
-        await send_button.click()
+        # click() already waits for the button to be visible, enabled and stable
+        await send_button.click(timeout=10000)
         logger.debug("Send button clicked successfully")
 
     except Exception as e:
@@ -904,7 +1224,7 @@ async def _handle_confirmation_dialog(page: Page, timeout: int) -> None:
     logger.debug("Waiting for deep-research-confirmation-widget to appear")
     try:
         confirmation_widget = page.locator("deep-research-confirmation-widget")
-        await confirmation_widget.wait_for(state="visible", timeout=20000)
+        await confirmation_widget.wait_for(state="visible", timeout=min(timeout * 1000, CONFIRMATION_WAIT_MS))
     except PlaywrightTimeoutError:
         logger.debug("No confirmation dialog appeared within timeout, continuing")
         return
@@ -912,37 +1232,26 @@ async def _handle_confirmation_dialog(page: Page, timeout: int) -> None:
         logger.warning(f"Failed while waiting for confirmation widget: {exc}")
         return
 
-    selectors = [
-        '[data-test-id="confirm-button"]',
-        "button:has-text('Start research')",
-        "button.confirm-button",
-    ]
-
-    for selector in selectors:
-        logger.debug(f"Trying confirmation selector: {selector}")
-        candidate = confirmation_widget.locator(selector)
-        try:
-            await candidate.wait_for(state="visible", timeout=5000)
-        except PlaywrightTimeoutError:
-            logger.debug(f"Selector timed out: {selector}")
-            continue
-        except Exception as exc:
-            logger.debug(f"Selector error ({selector}): {exc}")
-            continue
-
-        try:
+    # One wait on the union of the known button selectors instead of one per selector
+    candidate = confirmation_widget.locator(", ".join(CONFIRMATION_BUTTON_SELECTORS)).first
+    try:
+        await candidate.wait_for(state="visible", timeout=5000)
+        if _verbose_sink_id is not None:
             button_text = await candidate.text_content()
             logger.debug(f"Found confirmation button with text: '{(button_text or '').strip()}'")
-            try:
-                await candidate.click()
-            except Exception:
-                await candidate.click(force=True)
-            await asyncio.sleep(0.5)
-            logger.debug("Deep Research confirmation clicked successfully")
-            return
-        except Exception as exc:
-            logger.warning(f"Failed to click confirmation button ({selector}): {exc}")
-            continue
+        try:
+            await candidate.click()
+        except Exception:
+            await candidate.click(force=True)
+        logger.debug("Deep Research confirmation clicked successfully")
+        # Move on as soon as the widget goes away rather than after a fixed pause
+        with contextlib.suppress(PlaywrightTimeoutError):
+            await confirmation_widget.wait_for(state="hidden", timeout=5000)
+        return
+    except PlaywrightTimeoutError:
+        logger.debug("No known confirmation button became visible")
+    except Exception as exc:
+        logger.warning(f"Failed to click confirmation button: {exc}")
 
     logger.warning("Confirmation widget detected but no clickable button matched known selectors")
 
@@ -951,133 +1260,128 @@ async def _wait_for_sources_button(page: Page, timeout: int) -> None:
     """Wait for response completion using multiple indicators."""
     logger.info(f"⏱️ Waiting for response completion (timeout: {timeout}s)...")
 
-    # Multiple completion indicators to check
-    completion_selectors = [
-        "button[data-testid='sources-button']:visible",  # Sources button when available
-        "button:has-text('Sources'):visible",  # Sources button alternative
-        ".response-footer.complete",  # Complete class indicator
-        ".message-actions button:visible",  # Action buttons (copy, etc.)
-        "[data-testid='copy-button']:visible",  # Copy button
-    ]
-
-    start_time = asyncio.get_running_loop().time()
-    check_interval = 0.5  # Check every 500ms
+    now = asyncio.get_running_loop().time
+    deadline = now() + timeout
 
-    while (asyncio.get_running_loop().time() - start_time) < timeout:
+    while (remaining := deadline - now()) > 0:
         try:
-            # Check for any completion indicator
-            for selector in completion_selectors:
-                try:
-                    element = page.locator(selector).first
-                    if await element.count() > 0:
-                        indicator_type = "Sources button" if "sources" in selector.lower() else "completion indicator"
-                        logger.info(f"📚 {indicator_type} detected; response ready.")
-                        return
-                except Exception:
-                    continue  # Try next selector
-
-            # Also check if we have substantive content in message-content
-            try:
-                content_elements = page.locator("message-content")
-                if await content_elements.count() > 0:
-                    # Check if the content has meaningful text (not just loading indicators)
-                    content_text = await content_elements.first.text_content()
-                    if content_text and len(content_text.strip()) > 50:  # Arbitrary threshold
-                        # Wait a bit more to ensure content is fully loaded
-                        await asyncio.sleep(2)
-                        # Check again if it's stable
-                        new_content = await content_elements.first.text_content()
-                        if new_content == content_text:
-                            logger.info("📄 Response content appears complete.")
-                            return
-            except Exception:
-                pass  # Continue checking other indicators
-
-            await asyncio.sleep(check_interval)
-
+            # Evaluated in-page every RESPONSE_POLL_MS; resolves with the indicator that fired
+            handle = await page.wait_for_function(
+                _RESPONSE_READY_JS, arg=RESPONSE_STABLE_MS, polling=RESPONSE_POLL_MS, timeout=remaining * 1000
+            )
+            indicator = await handle.json_value()
+        except PlaywrightTimeoutError:
+            break
         except Exception as exc:
             logger.debug(f"Error during completion check: {exc}")
-            await asyncio.sleep(check_interval)
+            await asyncio.sleep(0.5)
+            continue
+
+        logger.info(f"📚 {indicator} detected; response ready.")
+        return
 
     # Timeout reached
     logger.info("⏳ Completion indicators not detected within timeout; proceeding with extraction.")
+    if _verbose_sink_id is None:
+        return  # The snapshot below is only ever logged at DEBUG level
     try:
-        content_length = len(await page.content())
-        logger.debug(f"📏 Page content length after timeout: {content_length}")
+        snapshot = await page.evaluate(_PAGE_SNAPSHOT_JS)
+        logger.debug(f"📏 Page state after timeout: {snapshot}")
     except Exception as exc:  # pragma: no cover - diagnostic logging only
         logger.debug(f"Unable to inspect page content after timeout: {exc}")
 
 
+def _as_marker(selector: str) -> tuple[str, str | None]:
+    """Split a Playwright ``css:has-text("...")`` selector into plain CSS and the text to match."""
+    if match := _HAS_TEXT_RE.match(selector):
+        return match["css"], match["text"]
+    return selector, None
+
+
+async def _wait_for_markers(page: Page, selectors: tuple[str, ...], timeout: float) -> str | None:
+    """Wait in-page for any of ``selectors`` to become visible.
+
+    A MutationObserver re-checks the selectors whenever the DOM changes, so the wait
+    ends as soon as one shows up instead of at the next polling tick.
+
+    Args:
+        page: Page to watch
+        selectors: CSS selectors, optionally ending in a Playwright ``:has-text("...")``
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        The selector that matched, or None if none did within ``timeout``
+    """
+    markers = [_as_marker(selector) for selector in selectors]
+    found = await page.evaluate(_WAIT_FOR_MARKERS_JS, [markers, int(timeout * 1000)])
+    return selectors[markers.index(tuple(found))] if found else None
+
+
+async def _report_research_progress(page: Page, start_time: float) -> None:
+    """Log Deep Research progress every 30 seconds until cancelled."""
+    now = asyncio.get_running_loop().time
+    while True:
+        await asyncio.sleep(30)
+        elapsed = now() - start_time
+        logger.info(f"📊 Deep Research still in progress... ({elapsed:.0f}s elapsed)")
+
+        # Read the research plan size and status line in one round trip
+        try:
+            progress = await page.evaluate(_RESEARCH_PROGRESS_JS)
+            if progress["steps"] > 0:
+                logger.info(f"📝 Research plan has {progress['steps']} steps")
+            if progress["status"]:
+                logger.info(f"⏰ Status: {progress['status']}")
+        except Exception:
+            pass  # Progress checking is best effort
+
+
 async def _wait_for_completion(page: Page, timeout: int) -> None:
     """Wait for Deep Research to complete and final Markdown response to be ready."""
     try:
-        # Wait for the export button or similar completion indicator
-        completion_indicators = [
-            '[data-test-id="export-menu-button"]',
-            'button:has-text("Export")',
-            'button:has-text("Copy")',
-            '[data-test-id="scroll-container"]',
-        ]
-
         logger.info(f"⏱️ Monitoring Deep Research progress (timeout: {timeout}s)...")
         completion_found = False
-        start_time = asyncio.get_running_loop().time()
-        last_progress_time = start_time
-
-        # Progress monitoring loop
-        while not completion_found and (asyncio.get_running_loop().time() - start_time) < timeout:
-            current_time = asyncio.get_running_loop().time()
-            elapsed = current_time - start_time
+        now = asyncio.get_running_loop().time
+        start_time = now()
+        reporter = asyncio.create_task(_report_research_progress(page, start_time))
 
-            # Report progress every 30 seconds
-            if current_time - last_progress_time >= 30:
-                logger.info(f"📊 Deep Research still in progress... ({elapsed:.0f}s elapsed)")
-                last_progress_time = current_time
-
-                # Check for research steps or progress indicators
-                try:
-                    # Look for research step indicators
-                    steps = page.locator('[data-test-id="research-steps"] .research-step')
-                    step_count = await steps.count()
-                    if step_count > 0:
-                        logger.info(f"📝 Research plan has {step_count} steps")
-
-                    # Check for any progress messages
-                    progress_msgs = page.locator(':has-text("Klaar over"), :has-text("Ready in"), :has-text("Done in")')
-                    if await progress_msgs.count() > 0:
-                        msg_text = await progress_msgs.first.text_content()
-                        logger.info(f"⏰ Status: {msg_text}")
-
-                except Exception:
-                    pass  # Progress checking is best effort
-
-            # Check for completion indicators
-            for indicator in completion_indicators:
+        try:
+            # One in-page observer for the whole budget; progress is reported alongside it
+            while (remaining := timeout - (now() - start_time)) > 0:
                 try:
-                    if await page.locator(indicator).is_visible():
-                        logger.info(f"🎯 Research completion detected: {indicator}")
-                        completion_found = True
-                        break
-                except Exception:
+                    indicator = await _wait_for_markers(page, RESEARCH_COMPLETION_INDICATORS, remaining)
+                except Exception as exc:
+                    # Navigation tears down the observer's execution context; re-arm on the new one
+                    logger.debug(f"Completion observer interrupted: {exc}")
+                    await asyncio.sleep(1)
                     continue
 
-            if not completion_found:
-                await asyncio.sleep(5)  # Check every 5 seconds
+                if indicator:
+                    logger.info(f"🎯 Research completion detected: {indicator}")
+                    completion_found = True
+                break
+        finally:
+            reporter.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reporter
 
         if not completion_found:
             logger.info("⏳ No completion indicators found, checking content-based completion...")
             # Check if there's substantial content on the page
-            content_length = len(await page.content())
+            snapshot = await page.evaluate(_PAGE_SNAPSHOT_JS)
+            content_length = snapshot["content_length"]
             logger.info(f"📏 Page content length: {content_length} characters")
+            logger.debug(f"📏 Page state after timeout: {snapshot}")
 
             if content_length > RESEARCH_CONTENT_MIN_LENGTH:
                 logger.info("✅ Research appears complete based on content length")
                 completion_found = True
 
-        # Give additional time for the final response to fully render
+        # Give the final response time to fully render, moving on once the page goes quiet
         if completion_found:
             logger.info("🔄 Waiting for final response to render...")
-            await asyncio.sleep(5)  # Allow time for final response to render
+            with contextlib.suppress(Exception):  # Best effort; extraction follows regardless
+                await page.evaluate(_AWAIT_DOM_QUIET_JS, [RENDER_QUIET_MS, RENDER_SETTLE_TIMEOUT_MS])
         else:
             msg = f"Deep Research did not complete within {timeout} seconds"
             raise PlayPiTimeoutError(msg)
@@ -3,20 +3,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 import typing
-from contextlib import AsyncExitStack, asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Self
 
 from loguru import logger
-from playwrightauthor import AsyncBrowser
-from playwrightauthor.exceptions import PlaywrightAuthorError
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, BrowserContext, Page
+    from playwright.async_api import Browser, BrowserContext, Page, Route
 
 from playpi.config import PlayPiConfig
 from playpi.exceptions import BrowserError, SessionError
 
+# Background analytics and log sinks that provider pages never need
+_TELEMETRY_URL_PATTERN = re.compile(
+    r"^https://(play\.google\.com/log\?|www\.google-analytics\.com/|www\.googletagmanager\.com/)"
+)
+
+# Idle pages a session keeps for reuse; pages given back beyond this are closed
+MAX_IDLE_PAGES = 4
+
+
+async def _abort_route(route: Route) -> None:
+    await route.abort()
+
 
 class PlayPiSession:
     """Manage a single PlayPi browser session via playwrightauthor."""
@@ -26,8 +38,12 @@ class PlayPiSession:
         self._exit_stack: AsyncExitStack | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
-        self._context_owned = False
         self._pages: list[Page] = []
+        # Pages owned by `acquire_page`, lent or idle; `get_page` never returns them
+        self._pooled_pages: set[Page] = set()
+        self._idle_pages: list[Page] = []
+        # Serializes start() and close(), so concurrent calls cannot tear down twice
+        self._lifecycle_lock = asyncio.Lock()
 
     async def __aenter__(self) -> Self:
         await self.start()
@@ -38,10 +54,18 @@ class PlayPiSession:
 
     async def start(self) -> None:
         """Launch browser resources using playwrightauthor."""
+        async with self._lifecycle_lock:
+            await self._launch()
+
+    async def _launch(self) -> None:
         if self._exit_stack is not None:
             logger.warning("Session already started")
             return
 
+        # playwrightauthor is slow to import; only pay for it once a browser is needed
+        from playwrightauthor import AsyncBrowser
+        from playwrightauthor.exceptions import PlaywrightAuthorError
+
         self._exit_stack = AsyncExitStack()
         try:
             logger.debug("Starting playwrightauthor AsyncBrowser")
@@ -53,25 +77,34 @@ class PlayPiSession:
             contexts = browser.contexts
             logger.debug(f"Existing browser contexts detected: {len(contexts)}")
             if contexts:
+                # The profile's own context outlives the session, so it is not closed
                 context = contexts[0]
-                self._context_owned = False
             else:
                 context = await browser.new_context()
                 self._exit_stack.push_async_callback(context.close)
-                self._context_owned = True
             self._context = context
+            # Runs before the context is closed, for the pages still open at that point
+            self._exit_stack.push_async_callback(self._close_pages)
+
+            if self.config.block_telemetry:
+                logger.debug("Blocking telemetry requests for the session context")
+                await context.route(_TELEMETRY_URL_PATTERN, _abort_route)
 
             await self.new_page()
 
             logger.info("PlayPi session started")
         except PlaywrightAuthorError as exc:  # pragma: no cover - bubble up descriptive message
-            await self.close()
+            await self._teardown()
             msg = f"Failed to start playwrightauthor session: {exc}"
             raise BrowserError(msg) from exc
         except Exception as exc:  # pragma: no cover - safeguard for unexpected errors
-            await self.close()
+            await self._teardown()
             msg = f"Failed to start browser session: {exc}"
             raise BrowserError(msg) from exc
+        except BaseException:
+            # Cancelled part-way: unwind the browser and context allocated so far
+            await self._teardown()
+            raise
 
     async def new_page(self) -> Page:
         """Create and return a new page."""
@@ -82,16 +115,79 @@ class PlayPiSession:
         logger.debug("Opening new page")
         page = await self._context.new_page()
         await page.bring_to_front()
-        self._exit_stack.push_async_callback(page.close)
+        # Forget pages once they close, so a long-lived session only tracks open ones
+        page.on("close", self._forget_page)
         self._pages.append(page)
         return page
 
+    def _forget_page(self, page: Page) -> None:
+        with suppress(ValueError):
+            self._pages.remove(page)
+        with suppress(ValueError):
+            self._idle_pages.remove(page)
+        self._pooled_pages.discard(page)
+
+    async def _close_pages(self) -> None:
+        for page in reversed(list(self._pages)):
+            with suppress(Exception):
+                await page.close()
+
+    @asynccontextmanager
+    async def acquire_page(self) -> typing.AsyncGenerator[Page]:
+        """Lend a page for one task, reusing one an earlier task gave back.
+
+        Afterwards the page is blanked, so the finished task's DOM does not stay
+        in memory, and kept for the next task. It is closed instead if the task
+        raised or ``MAX_IDLE_PAGES`` pages are already idle.
+
+        Pages from `start` and `new_page` are never lent: `get_page` hands them to
+        callers that drive them directly, so lending one would put two tasks on
+        the same tab. The first task therefore always opens a page of its own.
+        """
+        page = None
+        while self._idle_pages and page is None:
+            candidate = self._idle_pages.pop()
+            if not candidate.is_closed():
+                page = candidate
+        if page is None:
+            page = await self.new_page()
+            self._pooled_pages.add(page)
+
+        try:
+            yield page
+        except BaseException:
+            # A failed task may leave its page crashed or wedged; never hand it on
+            with suppress(Exception):
+                await page.close()
+            raise
+        await self._release_page(page)
+
+    async def _release_page(self, page: Page) -> None:
+        """Keep a page given back by `acquire_page` for reuse, or close it."""
+        if page.is_closed() or self._context is None:
+            return
+        if len(self._idle_pages) < MAX_IDLE_PAGES:
+            try:
+                await page.goto("about:blank")
+            except Exception as exc:
+                logger.debug(f"Could not blank page for reuse: {exc}")
+            else:
+                self._idle_pages.append(page)
+                return
+        with suppress(Exception):
+            await page.close()
+
     async def get_page(self) -> Page:
-        """Return the active Playwright page."""
-        if not self._pages:
-            message = "Session not started or no pages available. Call start() or new_page() first."
-            raise SessionError(message)
-        return self._pages[-1]
+        """Return the active Playwright page.
+
+        This is the page most recently opened by `start` or `new_page`; pages
+        lent out by `acquire_page` are skipped.
+        """
+        for page in reversed(self._pages):
+            if page not in self._pooled_pages:
+                return page
+        message = "Session not started or no pages available. Call start() or new_page() first."
+        raise SessionError(message)
 
     async def get_authenticated_page(self, _provider: str) -> Page:
         """Return an authenticated page for the requested provider.
@@ -103,6 +199,10 @@ class PlayPiSession:
 
     async def close(self) -> None:
         """Tear down all managed resources."""
+        async with self._lifecycle_lock:
+            await self._teardown()
+
+    async def _teardown(self) -> None:
         try:
             if self._exit_stack is not None:
                 await self._exit_stack.aclose()
@@ -110,8 +210,9 @@ class PlayPiSession:
             self._exit_stack = None
             self._browser = None
             self._context = None
-            self._context_owned = False
             self._pages = []
+            self._pooled_pages = set()
+            self._idle_pages = []
             logger.info("PlayPi session closed")
 
 
@@ -1,8 +1,12 @@
 # this_file: tests/test_cli_helpers.py
 """Tests for CLI helper functions."""
 
+import asyncio
 import io
 import json
+import os
+import threading
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
 
@@ -19,8 +23,7 @@ async def test_gemi_command_when_file_and_prompt_merges_and_writes(tmp_path, mon
     output_file = tmp_path / "out.md"
 
     async_mock = AsyncMock(return_value="RESULT")
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask", async_mock)
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask_deep_think", AsyncMock())
+    monkeypatch.setattr(cli_helpers, "_GEMI_PROVIDERS", (async_mock, AsyncMock()))
 
     await cli_helpers.gemi_command(
         file_prompt=str(prompt_file),
@@ -42,8 +45,7 @@ async def test_gemi_command_when_deep_calls_deep_think(monkeypatch):
 
     ask_mock = AsyncMock(return_value="STD")
     deep_mock = AsyncMock(return_value="DEEP")
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask", ask_mock)
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask_deep_think", deep_mock)
+    monkeypatch.setattr(cli_helpers, "_GEMI_PROVIDERS", (ask_mock, deep_mock))
 
     result_path = await cli_helpers.gemi_command(prompt="hello", deep=True)
 
@@ -59,13 +61,63 @@ async def test_gemi_command_without_prompt_raises(monkeypatch):
     """`gemi_command` should require some prompt content."""
     from playpi.providers.google import cli_helpers
 
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask", AsyncMock())
-    monkeypatch.setattr(cli_helpers, "google_gemini_ask_deep_think", AsyncMock())
+    monkeypatch.setattr(cli_helpers, "_GEMI_PROVIDERS", (AsyncMock(), AsyncMock()))
 
     with pytest.raises(ValueError):
         await cli_helpers.gemi_command()
 
 
+@pytest.mark.asyncio
+async def test_google_research_command_reuses_cached_result(tmp_path, monkeypatch):
+    """`google_research_command` should answer repeated prompts from `cache_dir`."""
+    from playpi.providers.google import cli_helpers
+
+    research_mock = AsyncMock(return_value="# Research")
+    monkeypatch.setattr(cli_helpers, "google_gemini_deep_research", research_mock)
+
+    first = await cli_helpers.google_research_command("topic", cache_dir=tmp_path)
+    second = await cli_helpers.google_research_command("topic", cache_dir=tmp_path)
+
+    assert first == second == "# Research"
+    research_mock.assert_awaited_once()
+    assert len(list(tmp_path.glob("*.md"))) == 1
+
+
+def test_google_research_command_locks_do_not_outlive_the_event_loop(tmp_path, monkeypatch):
+    """Concurrent duplicate prompts should work again under a new event loop."""
+    from playpi.providers.google import cli_helpers
+
+    async def research(*_args, **_kwargs):
+        await asyncio.sleep(0)  # Keep the first call holding the lock while the second waits
+        return "# Research"
+
+    research_mock = AsyncMock(side_effect=research)
+    monkeypatch.setattr(cli_helpers, "google_gemini_deep_research", research_mock)
+
+    async def run_twice(cache_dir):
+        return await asyncio.gather(*(cli_helpers.google_research_command("topic", cache_dir=cache_dir) for _ in "ab"))
+
+    assert asyncio.run(run_twice(tmp_path / "first")) == ["# Research", "# Research"]
+    assert asyncio.run(run_twice(tmp_path / "second")) == ["# Research", "# Research"]
+    assert research_mock.await_count == 2
+    assert cli_helpers._research_cache_locks == {}
+
+
+def test_write_cache_entry_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    """A failed cache write should not leave its temporary file behind."""
+    from playpi.providers.google import cli_helpers
+
+    def fail_replace(*_args):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+
+    with pytest.raises(OSError, match="No space left"):
+        cli_helpers._write_cache_entry(tmp_path / "entry.md", "# Research")
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def _invoke_gemi_dr(config: Any, monkeypatch):
     from playpi.providers.google import cli_helpers
 
@@ -86,10 +138,20 @@ async def test_gemi_dr_command_reads_stdin_json(monkeypatch):
 
     result = await cli_helpers.gemi_dr_command()
 
-    mock.assert_awaited_once_with(config)
+    mock.assert_awaited_once_with(config, max_concurrency=None, qpm=None, return_exceptions=True)
     assert result == ["ok"]
 
 
+@pytest.mark.asyncio
+async def test_gemi_dr_command_forwards_concurrency_limits(monkeypatch):
+    """`gemi_dr_command` should pass scheduling limits to the provider."""
+    cli_helpers, mock = _invoke_gemi_dr({"prompt": "one"}, monkeypatch)
+
+    await cli_helpers.gemi_dr_command(max_concurrency=8, qpm=30)
+
+    mock.assert_awaited_once_with([{"prompt": "one"}], max_concurrency=8, qpm=30, return_exceptions=True)
+
+
 @pytest.mark.asyncio
 async def test_gemi_dr_command_invalid_json_raises(monkeypatch):
     """`gemi_dr_command` should raise ValueError on invalid JSON."""
@@ -100,3 +162,84 @@ async def test_gemi_dr_command_invalid_json_raises(monkeypatch):
 
     with pytest.raises(ValueError):
         await cli_helpers.gemi_dr_command()
+
+
+@pytest.mark.asyncio
+async def test_gemi_dr_command_accepts_json_lines(monkeypatch):
+    """`gemi_dr_command` should accept one JSON job per line."""
+    from playpi.providers.google import cli_helpers
+
+    mock = AsyncMock(return_value=["ok", "ok"])
+    monkeypatch.setattr(cli_helpers, "google_gemini_deep_research_multi", mock)
+    monkeypatch.setattr(cli_helpers, "_stdin", io.StringIO('{"prompt": "one"}\n\n{"prompt": "two"}\n'))
+
+    await cli_helpers.gemi_dr_command()
+
+    mock.assert_awaited_once_with(
+        [{"prompt": "one"}, {"prompt": "two"}], max_concurrency=None, qpm=None, return_exceptions=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_gemi_dr_command_rejects_mistyped_job(monkeypatch):
+    """`gemi_dr_command` should reject jobs whose fields are not strings."""
+    cli_helpers, mock = _invoke_gemi_dr([{"prompt": 42}], monkeypatch)
+
+    with pytest.raises(ValueError, match="'prompt' must be a string"):
+        await cli_helpers.gemi_dr_command()
+
+    mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gemi_dr_command_reports_all_invalid_jobs(monkeypatch):
+    """`gemi_dr_command` should list every invalid job before running any."""
+    cli_helpers, mock = _invoke_gemi_dr([{"prompt": "ok"}, {"output_path": "x.md"}, "nope"], monkeypatch)
+
+    with pytest.raises(ValueError, match="job 1: provide 'prompt' or 'prompt_path'; job 2 must be a JSON object"):
+        await cli_helpers.gemi_dr_command()
+
+    mock.assert_not_called()
+
+
+def test_gemi_dr_cli_exits_nonzero_when_a_job_fails(monkeypatch, capsys):
+    """`playpi gemi_dr` should report failed jobs and exit with status 1."""
+    from playpi import __main__ as cli
+    from playpi.providers.google import cli_helpers
+
+    monkeypatch.setattr(
+        cli_helpers, "gemi_dr_command", AsyncMock(return_value=["## Done", RuntimeError("page crashed")])
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.gemi_dr()
+
+    assert exc_info.value.code == 1
+    assert "page crashed" in capsys.readouterr().out
+
+
+def test_read_prompt_file_reads_pipes():
+    """Prompt files that are pipes (e.g. `<(cmd)`) should be read, not treated as empty."""
+    from playpi.providers.google import cli_helpers
+
+    read_fd, write_fd = os.pipe()
+
+    def feed():
+        with os.fdopen(write_fd, "wb") as writer:
+            writer.write(b"hello from pipe\n")
+
+    threading.Thread(target=feed).start()
+    try:
+        assert cli_helpers._read_prompt_file(Path(f"/dev/fd/{read_fd}")) == "hello from pipe"
+    finally:
+        os.close(read_fd)
+
+
+def test_read_prompt_file_normalises_line_endings(tmp_path):
+    """CRLF and CR prompt files should reach Gemini with plain newlines, as with text-mode reads."""
+    from playpi.providers.google import cli_helpers
+
+    prompt_path = tmp_path / "prompt.txt"
+    prompt_path.write_bytes(b"line1\r\nline2\rline3\r\n")
+
+    assert cli_helpers._read_prompt_file(prompt_path) == "line1\nline2\nline3"
@@ -1,23 +1,58 @@
 # this_file: tests/test_google_gemini.py
 """Tests for the Google Gemini provider."""
 
+import asyncio
+import os
 import pathlib
-import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from playpi.exceptions import PlayPiTimeoutError
+from playpi.providers.google import gemini
 from playpi.providers.google.gemini import (
+    _activate_deep_research,
+    _activate_deep_think,
+    _click_send_button,
+    _download_generated_image,
+    _enter_prompt,
+    _extract_simple_response,
+    _extract_sources_content,
     _handle_confirmation_dialog,
+    _wait_for_any,
+    _wait_for_completion,
     _wait_for_sources_button,
     google_gemini_ask,
     google_gemini_ask_deep_think,
     google_gemini_deep_research,
+    google_gemini_deep_research_batch,
     google_gemini_deep_research_full,
     google_gemini_deep_research_multi,
+    google_gemini_deep_research_stream,
     google_gemini_generate_image,
 )
+from playpi.session import PlayPiSession
+
+
+@pytest.fixture
+def mock_page():
+    """Patch create_session and return the page its session hands out."""
+    page = AsyncMock()
+    with patch("playpi.providers.google.gemini.create_session") as mock_create_session:
+        mock_create_session.return_value.__aenter__.return_value.get_authenticated_page.return_value = page
+        yield page
+
+
+def _mock_page_session() -> PlayPiSession:
+    """Return a started session whose new_page() hands out distinct open pages."""
+    session = PlayPiSession()
+    session._context = MagicMock()
+    session.new_page = AsyncMock(
+        side_effect=lambda: MagicMock(is_closed=MagicMock(return_value=False), close=AsyncMock(), goto=AsyncMock())
+    )
+    return session
 
 
 @pytest.mark.asyncio
@@ -40,74 +75,294 @@ async def test_google_gemini_deep_research(mock_create_session):
 
 @pytest.mark.asyncio
 @patch("playpi.providers.google.gemini.google_gemini_deep_research")
-async def test_google_gemini_deep_research_full(mock_google_gemini_deep_research):
+async def test_google_gemini_deep_research_full(mock_google_gemini_deep_research, tmp_path):
     """Test the google_gemini_deep_research_full function."""
     mock_google_gemini_deep_research.return_value = "## Test Result"
-
-    with patch("builtins.open", new_callable=unittest.mock.mock_open) as mock_open:
-        # Test with prompt_path and output_path
-        mock_open.return_value.read.return_value = "file prompt"
-        result = await google_gemini_deep_research_full(
-            prompt="test prompt", prompt_path="/fake/prompt.txt", output_path="/fake/output.txt"
-        )
-        assert result == pathlib.Path("/fake/output.txt")
-        mock_open.assert_any_call("/fake/prompt.txt")
-        mock_open.assert_any_call("/fake/output.txt", "w")
-        mock_google_gemini_deep_research.assert_called_once_with("file prompt\ntest prompt")
-
-        # Test with only prompt
-        mock_google_gemini_deep_research.reset_mock()
-        result = await google_gemini_deep_research_full(prompt="test prompt")
-        assert result == "## Test Result"
-        mock_google_gemini_deep_research.assert_called_once_with("test prompt")
-
-        # Test with only prompt_path
-        mock_google_gemini_deep_research.reset_mock()
-        mock_open.return_value.read.return_value = "file prompt"
-        result = await google_gemini_deep_research_full(prompt_path="/fake/prompt.txt")
-        assert result == "## Test Result"
-        mock_google_gemini_deep_research.assert_called_once_with("file prompt")
-
-        # Test with no prompt
-        with pytest.raises(ValueError):
-            await google_gemini_deep_research_full()
+    prompt_path = tmp_path / "prompt.txt"
+    prompt_path.write_text("file prompt")
+    output_path = tmp_path / "output.txt"
+
+    # Test with prompt_path and output_path
+    result = await google_gemini_deep_research_full(
+        prompt="test prompt", prompt_path=prompt_path, output_path=output_path
+    )
+    assert result == output_path
+    assert output_path.read_text() == "## Test Result"
+    mock_google_gemini_deep_research.assert_called_once_with("file prompt\ntest prompt")
+
+    # Test with only prompt
+    mock_google_gemini_deep_research.reset_mock()
+    result = await google_gemini_deep_research_full(prompt="test prompt")
+    assert result == "## Test Result"
+    mock_google_gemini_deep_research.assert_called_once_with("test prompt")
+
+    # Test with only prompt_path
+    mock_google_gemini_deep_research.reset_mock()
+    result = await google_gemini_deep_research_full(prompt_path=prompt_path)
+    assert result == "## Test Result"
+    mock_google_gemini_deep_research.assert_called_once_with("file prompt")
+
+    # Test with no prompt
+    with pytest.raises(ValueError):
+        await google_gemini_deep_research_full()
 
 
 @pytest.mark.asyncio
 @patch("playpi.providers.google.gemini.create_session")
 @patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page")
-async def test_google_gemini_deep_research_multi(mock_research_on_page, mock_create_session):
+async def test_google_gemini_deep_research_multi(mock_research_on_page, mock_create_session, tmp_path):
     """Test the google_gemini_deep_research_multi function."""
-    mock_session = AsyncMock()
-    mock_page = AsyncMock()
-    mock_session.new_page.return_value = mock_page
-    mock_create_session.return_value.__aenter__.return_value = mock_session
+    mock_create_session.return_value.__aenter__.return_value = _mock_page_session()
     mock_research_on_page.return_value = "## Test Result"
 
     config = [
-        {"prompt": "prompt1", "output_path": "/fake/output1.txt"},
-        {"prompt": "prompt2", "output_path": "/fake/output2.txt"},
+        {"prompt": "prompt1", "output_path": str(tmp_path / "output1.txt")},
+        {"prompt": "prompt2", "output_path": str(tmp_path / "output2.txt")},
     ]
 
-    with patch("builtins.open", new_callable=unittest.mock.mock_open) as mock_open:
-        results = await google_gemini_deep_research_multi(config)
-        assert len(results) == 2
-        assert results[0] == pathlib.Path("/fake/output1.txt")
-        assert results[1] == pathlib.Path("/fake/output2.txt")
-        assert mock_research_on_page.call_count == 2
-        mock_open.assert_any_call("/fake/output1.txt", "w")
-        mock_open.assert_any_call("/fake/output2.txt", "w")
+    results = await google_gemini_deep_research_multi(config)
+    assert results == [tmp_path / "output1.txt", tmp_path / "output2.txt"]
+    assert mock_research_on_page.call_count == 2
+    assert (tmp_path / "output1.txt").read_text() == "## Test Result"
+    assert (tmp_path / "output2.txt").read_text() == "## Test Result"
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page")
+async def test_google_gemini_deep_research_multi_shared_prompt_file(mock_research_on_page, tmp_path):
+    """Concurrent jobs sharing a prompt file should share one read of it."""
+    mock_research_on_page.return_value = "## Test Result"
+    prompt_path = tmp_path / "base.txt"
+    prompt_path.write_text("base")
+
+    def slow_read(path, *args, **kwargs):
+        time.sleep(0.05)  # Keep the first read in flight while the other jobs ask for it
+        return original_read_text(path, *args, **kwargs)
+
+    original_read_text = pathlib.Path.read_text
+    jobs = [{"prompt_path": str(prompt_path), "prompt": name} for name in ("one", "two", "three")]
+    with patch("pathlib.Path.read_text", autospec=True, side_effect=slow_read) as mock_read:
+        await google_gemini_deep_research_multi(jobs, session=_mock_page_session())
+
+    prompts = sorted(call.args[1] for call in mock_research_on_page.call_args_list)
+    assert prompts == ["base\none", "base\nthree", "base\ntwo"]
+    assert mock_read.call_count == 1
+
+    # A modified file is read again
+    prompt_path.write_text("changed")
+    os.utime(prompt_path, ns=(0, prompt_path.stat().st_mtime_ns + 1))
+    with patch("pathlib.Path.read_text", autospec=True, side_effect=original_read_text) as mock_read:
+        await google_gemini_deep_research_multi([jobs[0]], session=_mock_page_session())
+
+    assert mock_research_on_page.call_args.args[1] == "changed\none"
+    assert mock_read.call_count == 1
 
 
 @pytest.mark.asyncio
 @patch("playpi.providers.google.gemini.create_session")
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page")
+async def test_google_gemini_deep_research_multi_reuses_session(mock_research_on_page, mock_create_session):
+    """An explicit session should be used as-is instead of launching a new one."""
+    session = _mock_page_session()
+    mock_research_on_page.return_value = "## Test Result"
+
+    results = await google_gemini_deep_research_multi([{"prompt": "one"}, {"prompt": "two"}], session=session)
+
+    assert results == ["## Test Result", "## Test Result"]
+    mock_create_session.assert_not_called()
+    session.new_page.assert_awaited()
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_multi_reuses_pages(mock_research_on_page):
+    """Finished jobs should hand their page to the next job instead of opening another."""
+    session = _mock_page_session()
+
+    async def research(*_args, **_kwargs):
+        await asyncio.sleep(0)  # Let the other job start while this one holds its page
+        return "## Test Result"
+
+    mock_research_on_page.side_effect = research
+
+    await google_gemini_deep_research_multi([{"prompt": str(i)} for i in range(5)], max_concurrency=2, session=session)
+
+    assert session.new_page.await_count == 2
+    assert mock_research_on_page.await_count == 5
+    # The pages go back to the caller's session, blanked, for its next calls
+    pages = {call.args[0] for call in mock_research_on_page.await_args_list}
+    assert set(session._idle_pages) == pages
+    assert all(page.close.await_count == 0 for page in pages)
+    assert all(page.goto.await_args == call("about:blank") for page in pages)
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_stream_yields_in_completion_order(mock_research_on_page):
+    """A finished job should be handed over while slower ones are still running."""
+    release_slow = asyncio.Event()
+
+    async def research(_page, prompt, **_kwargs):
+        if prompt == "slow":
+            await release_slow.wait()
+        return prompt
+
+    mock_research_on_page.side_effect = research
+    jobs = google_gemini_deep_research_stream([{"prompt": "slow"}, {"prompt": "fast"}], session=_mock_page_session())
+
+    assert await anext(jobs) == (1, "fast")
+    release_slow.set()
+    assert await anext(jobs) == (0, "slow")
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_stream_cancels_unfinished_jobs_on_close(mock_research_on_page):
+    """Leaving the stream early should cancel the jobs still running and close their pages."""
+    session = _mock_page_session()
+
+    async def research(_page, prompt, **_kwargs):
+        if prompt == "slow":
+            await asyncio.Event().wait()
+        return prompt
+
+    mock_research_on_page.side_effect = research
+    jobs = google_gemini_deep_research_stream([{"prompt": "slow"}, {"prompt": "fast"}], session=session)
+
+    assert await anext(jobs) == (1, "fast")
+    await jobs.aclose()
+
+    slow_page, fast_page = (call.args[0] for call in mock_research_on_page.await_args_list)
+    slow_page.close.assert_awaited_once()
+    assert session._idle_pages == [fast_page]
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_multi_discards_failed_pages(mock_research_on_page):
+    """A page whose job failed should be closed, and the next job should get a fresh one."""
+    session = _mock_page_session()
+    mock_research_on_page.side_effect = [RuntimeError("page crashed"), "## Test Result"]
+
+    results = await google_gemini_deep_research_multi(
+        [{"prompt": "bad"}, {"prompt": "good"}], max_concurrency=1, session=session, return_exceptions=True
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "## Test Result"
+    assert session.new_page.await_count == 2
+    bad_page, good_page = (call.args[0] for call in mock_research_on_page.await_args_list)
+    assert bad_page is not good_page
+    bad_page.close.assert_awaited_once()
+    good_page.close.assert_not_awaited()
+    assert session._idle_pages == [good_page]
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_multi_raises_first_failure(mock_research_on_page):
+    """By default a failed job should raise, cancelling the jobs still running."""
+    session = _mock_page_session()
+    crash = RuntimeError("page crashed")
+
+    async def research(_page, prompt, **_kwargs):
+        if prompt == "slow":
+            await asyncio.Event().wait()
+        raise crash
+
+    mock_research_on_page.side_effect = research
+
+    with pytest.raises(RuntimeError, match="page crashed"):
+        await google_gemini_deep_research_multi([{"prompt": "slow"}, {"prompt": "bad"}], session=session)
+
+    slow_page, bad_page = (call.args[0] for call in mock_research_on_page.await_args_list)
+    slow_page.close.assert_awaited_once()
+    bad_page.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_multi_checks_login_once(mock_research_on_page):
+    """Later jobs should skip the login check, until a job fails."""
+    mock_research_on_page.side_effect = ["## One", RuntimeError("signed out"), "## Three", "## Four"]
+
+    await google_gemini_deep_research_multi(
+        [{"prompt": str(i)} for i in range(4)], max_concurrency=1, session=_mock_page_session(), return_exceptions=True
+    )
+
+    assert [call.kwargs["authenticated"] for call in mock_research_on_page.await_args_list] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("limits", "message"), [({"max_concurrency": 0}, "max_concurrency"), ({"qpm": 0}, "qpm")])
+async def test_google_gemini_deep_research_multi_rejects_bad_limits(limits, message):
+    """Limits that would stall or break the batch should fail before any job starts."""
+    session = AsyncMock()
+
+    with pytest.raises(ValueError, match=message):
+        await google_gemini_deep_research_multi([{"prompt": "one"}], session=session, **limits)
+
+    session.new_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "first"), [(google_gemini_ask, "one"), (google_gemini_deep_research_multi, [{"prompt": "one"}])]
+)
+async def test_gemini_calls_reject_unknown_options(call, first):
+    """A misspelt option should fail loudly instead of silently falling back to the default."""
+    session = AsyncMock()
+
+    with pytest.raises(TypeError, match="heedless"):
+        await call(first, session=session, heedless=True)
+
+    session.new_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini.asyncio.Semaphore", wraps=asyncio.Semaphore)
+@patch("playpi.providers.google.gemini._google_gemini_deep_research_on_page", new=AsyncMock())
+async def test_google_gemini_deep_research_multi_concurrency_from_env(mock_semaphore, monkeypatch):
+    """PLAYPI_CONCURRENCY should set the default job limit."""
+    monkeypatch.setenv("PLAYPI_CONCURRENCY", "7")
+
+    await google_gemini_deep_research_multi([{"prompt": "one"}], session=_mock_page_session())
+    await google_gemini_deep_research_multi([{"prompt": "one"}], max_concurrency=2, session=_mock_page_session())
+
+    assert [call.args for call in mock_semaphore.call_args_list] == [(7,), (2,)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+async def test_google_gemini_deep_research_multi_rejects_bad_concurrency_env(value, monkeypatch):
+    """An unusable PLAYPI_CONCURRENCY should be reported by name instead of hanging or crashing."""
+    monkeypatch.setenv("PLAYPI_CONCURRENCY", value)
+
+    with pytest.raises(ValueError, match="PLAYPI_CONCURRENCY"):
+        await google_gemini_deep_research_multi([{"prompt": "one"}], session=_mock_page_session())
+
+
+@pytest.mark.asyncio
+@patch("playpi.providers.google.gemini.google_gemini_deep_research_multi", new_callable=AsyncMock)
+async def test_google_gemini_deep_research_batch(mock_multi):
+    """Batch helper should route all prompts through one multi call."""
+    mock_multi.return_value = ["## One", "## Two"]
+
+    results = await google_gemini_deep_research_batch(["one", "two"], verbose=True)
+
+    assert results == ["## One", "## Two"]
+    mock_multi.assert_awaited_once_with([{"prompt": "one"}, {"prompt": "two"}], verbose=True)
+
+
+@pytest.mark.asyncio
 @patch("playpi.providers.google.gemini._download_generated_image")
-async def test_google_gemini_generate_image(mock_download, mock_create_session):
+async def test_google_gemini_generate_image(mock_download, mock_page):
     """Test the google_gemini_generate_image function."""
-    mock_session = AsyncMock()
-    mock_page = AsyncMock()
-    mock_session.get_authenticated_page.return_value = mock_page
-    mock_create_session.return_value.__aenter__.return_value = mock_session
     mock_download.return_value = "/fake/image.png"
 
     with (
@@ -115,7 +370,6 @@ async def test_google_gemini_generate_image(mock_download, mock_create_session):
         patch("playpi.providers.google.gemini._activate_image_generation", new_callable=AsyncMock) as mock_activate,
         patch("playpi.providers.google.gemini._enter_prompt", new_callable=AsyncMock) as mock_enter_prompt,
         patch("playpi.providers.google.gemini._click_send_button", new_callable=AsyncMock) as mock_click_send,
-        patch("playpi.providers.google.gemini._wait_for_image_generation", new_callable=AsyncMock) as mock_wait,
     ):
         result = await google_gemini_generate_image("a cat", download_path="/fake")
 
@@ -124,25 +378,40 @@ async def test_google_gemini_generate_image(mock_download, mock_create_session):
         mock_activate.assert_called_once_with(mock_page)
         mock_enter_prompt.assert_called_once_with(mock_page, "a cat")
         mock_click_send.assert_called_once_with(mock_page)
-        mock_wait.assert_called_once()
-        mock_download.assert_called_once_with(mock_page, "/fake")
+        mock_download.assert_called_once_with(mock_page, "/fake", 600_000)
 
 
 @pytest.mark.asyncio
-@patch("playpi.providers.google.gemini.create_session")
-async def test_google_gemini_ask_deep_think(mock_create_session):
-    """Test the google_gemini_ask_deep_think function."""
-    mock_session = AsyncMock()
-    mock_page = AsyncMock()
-    mock_session.get_authenticated_page.return_value = mock_page
-    mock_create_session.return_value.__aenter__.return_value = mock_session
+async def test_download_generated_image_saves_download_event(tmp_path):
+    """The image should be saved straight from Playwright's download event."""
+    download = AsyncMock()
+    download.suggested_filename = "cat.png"
+    download_info = MagicMock()
+    download_info.value = asyncio.get_running_loop().create_future()
+    download_info.value.set_result(download)
+    mock_page = MagicMock()
+    mock_page.locator.return_value.first.click = AsyncMock()
+    mock_page.expect_download.return_value.__aenter__ = AsyncMock(return_value=download_info)
+    mock_page.expect_download.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    result = await _download_generated_image(mock_page, str(tmp_path / "images"), 60_000)
+
+    assert result == str(tmp_path / "images" / "cat.png")
+    assert (tmp_path / "images").is_dir()
+    mock_page.expect_download.assert_called_once_with(timeout=60_000)
+    mock_page.locator.return_value.first.click.assert_awaited_once_with(timeout=60_000)
+    download.save_as.assert_awaited_once_with(result)
 
+
+@pytest.mark.asyncio
+async def test_google_gemini_ask_deep_think(mock_page):
+    """Test the google_gemini_ask_deep_think function."""
     with (
         patch("playpi.providers.google.gemini.ensure_authenticated", new_callable=AsyncMock) as mock_auth,
         patch("playpi.providers.google.gemini._activate_deep_think", new_callable=AsyncMock) as mock_activate,
         patch("playpi.providers.google.gemini._enter_prompt", new_callable=AsyncMock) as mock_enter_prompt,
         patch("playpi.providers.google.gemini._click_send_button", new_callable=AsyncMock) as mock_click_send,
-        patch("playpi.providers.google.gemini._wait_for_sources_button", new_callable=AsyncMock) as mock_wait,
+        patch("playpi.providers.google.gemini._wait_for_completion", new_callable=AsyncMock) as mock_wait,
         patch("playpi.providers.google.gemini.extract_research_content", new_callable=AsyncMock) as mock_extract,
         patch("playpi.providers.google.gemini.html_to_markdown") as mock_markdown,
     ):
@@ -162,20 +431,14 @@ async def test_google_gemini_ask_deep_think(mock_create_session):
 
 
 @pytest.mark.asyncio
-@patch("playpi.providers.google.gemini.create_session")
-async def test_google_gemini_ask(mock_create_session):
+async def test_google_gemini_ask(mock_page):
     """Test the google_gemini_ask function."""
-    mock_session = AsyncMock()
-    mock_page = AsyncMock()
-    mock_session.get_authenticated_page.return_value = mock_page
-    mock_create_session.return_value.__aenter__.return_value = mock_session
-
     with (
         patch("playpi.providers.google.gemini.ensure_authenticated", new_callable=AsyncMock) as mock_auth,
         patch("playpi.providers.google.gemini._enter_prompt", new_callable=AsyncMock) as mock_enter_prompt,
         patch("playpi.providers.google.gemini._click_send_button", new_callable=AsyncMock) as mock_click_send,
-        patch("playpi.providers.google.gemini._wait_for_completion", new_callable=AsyncMock) as mock_wait,
-        patch("playpi.providers.google.gemini._extract_simple_response", new_callable=AsyncMock) as mock_extract,
+        patch("playpi.providers.google.gemini._wait_for_sources_button", new_callable=AsyncMock) as mock_wait,
+        patch("playpi.providers.google.gemini._extract_enhanced_response", new_callable=AsyncMock) as mock_extract,
     ):
         mock_extract.return_value = "## Test Result"
 
@@ -190,56 +453,67 @@ async def test_google_gemini_ask(mock_create_session):
 
 
 @pytest.mark.asyncio
-async def test_handle_confirmation_dialog_clicks_primary_locator():
-    """Confirmation helper should click the primary data-test-id button."""
+@patch("playpi.providers.google.gemini.create_session")
+async def test_google_gemini_ask_reuses_caller_session(mock_create_session):
+    """A caller-owned session should lend a page, get it back afterwards, and stay open."""
+    session = _mock_page_session()
+    session.close = AsyncMock()
+
+    with (
+        patch("playpi.providers.google.gemini.ensure_authenticated", new_callable=AsyncMock),
+        patch("playpi.providers.google.gemini._enter_prompt", new_callable=AsyncMock),
+        patch("playpi.providers.google.gemini._click_send_button", new_callable=AsyncMock),
+        patch("playpi.providers.google.gemini._wait_for_sources_button", new_callable=AsyncMock),
+        patch("playpi.providers.google.gemini._extract_enhanced_response", AsyncMock(return_value="## Answer")),
+    ):
+        assert await google_gemini_ask("a question", session=session) == "## Answer"
+
+    mock_create_session.assert_not_called()
+    (page,) = session._idle_pages
+    assert page.goto.await_args_list == [call("https://gemini.google.com/app", timeout=30000), call("about:blank")]
+    page.close.assert_not_awaited()
+    session.close.assert_not_called()
+
+
+def _mock_confirmation_page(click: AsyncMock) -> tuple[MagicMock, MagicMock, MagicMock]:
+    """Return a page showing the confirmation widget, the widget, and its start button."""
     page = MagicMock()
-    widget = MagicMock()
-    confirm_button = MagicMock()
-
-    widget.wait_for = AsyncMock()
-    widget.locator.return_value = confirm_button
-    confirm_button.wait_for = AsyncMock()
-    confirm_button.click = AsyncMock()
-    confirm_button.text_content = AsyncMock(return_value="Start research")
+    widget = MagicMock(wait_for=AsyncMock())
+    button = MagicMock(wait_for=AsyncMock(), click=click)
+    widget.locator.return_value.first = button
     page.locator.return_value = widget
+    return page, widget, button
+
+
+@pytest.mark.asyncio
+async def test_handle_confirmation_dialog_clicks_primary_locator():
+    """Confirmation helper should click the primary data-test-id button."""
+    page, widget, button = _mock_confirmation_page(AsyncMock())
 
     await _handle_confirmation_dialog(page, timeout=15)
 
-    widget.wait_for.assert_awaited_once()
-    widget.locator.assert_called_with('[data-test-id="confirm-button"]')
-    confirm_button.click.assert_awaited_once()
+    assert widget.wait_for.await_count == 2
+    widget.wait_for.assert_awaited_with(state="hidden", timeout=5000)
+    widget.locator.assert_called_once_with(", ".join(gemini.CONFIRMATION_BUTTON_SELECTORS))
+    button.click.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_handle_confirmation_dialog_falls_back_to_text_selector():
-    """Helper should fall back when the data-test-id lookup fails."""
-    page = MagicMock()
-    widget = MagicMock()
-    primary_button = MagicMock()
-    fallback_button = MagicMock()
-
-    widget.wait_for = AsyncMock()
-    widget.locator.side_effect = [primary_button, fallback_button]
-    primary_button.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("missing"))
-    fallback_button.wait_for = AsyncMock()
-    fallback_button.click = AsyncMock()
-    fallback_button.text_content = AsyncMock(return_value="Start research")
-    page.locator.return_value = widget
+async def test_handle_confirmation_dialog_falls_back_to_forced_click():
+    """Helper should force the click when the regular click is intercepted."""
+    page, _widget, button = _mock_confirmation_page(AsyncMock(side_effect=[RuntimeError("intercepted"), None]))
 
     await _handle_confirmation_dialog(page, timeout=15)
 
-    assert widget.locator.call_count >= 2
-    fallback_button.click.assert_awaited_once()
+    button.wait_for.assert_awaited_once_with(state="visible", timeout=5000)
+    button.click.assert_awaited_with(force=True)
 
 
 @pytest.mark.asyncio
 async def test_handle_confirmation_dialog_handles_missing_widget():
     """Helper should swallow widget timeouts for resilience."""
-    page = MagicMock()
-    widget = MagicMock()
-
-    widget.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("no widget"))
-    page.locator.return_value = widget
+    page, widget, _button = _mock_confirmation_page(AsyncMock())
+    widget.wait_for.side_effect = PlaywrightTimeoutError("no widget")
 
     await _handle_confirmation_dialog(page, timeout=15)
 
@@ -248,28 +522,260 @@ async def test_handle_confirmation_dialog_handles_missing_widget():
 
 @pytest.mark.asyncio
 async def test_wait_for_sources_button_when_visible():
-    """Sources button wait helper waits for visibility."""
+    """Sources button wait helper returns once the in-page check reports an indicator."""
     page = MagicMock()
-    button = MagicMock()
-    button.wait_for = AsyncMock()
-    page.get_by_role.return_value = button
+    handle = MagicMock()
+    handle.json_value = AsyncMock(return_value="Sources button")
+    page.wait_for_function = AsyncMock(return_value=handle)
 
     await _wait_for_sources_button(page, timeout=5)
 
-    page.get_by_role.assert_called_once_with("button", name="Sources")
-    button.wait_for.assert_awaited_once_with(state="visible", timeout=5000)
+    page.wait_for_function.assert_awaited_once()
+    assert page.wait_for_function.await_args.args == (gemini._RESPONSE_READY_JS,)
+    kwargs = page.wait_for_function.await_args.kwargs
+    assert kwargs["arg"] == gemini.RESPONSE_STABLE_MS
+    assert kwargs["polling"] == gemini.RESPONSE_POLL_MS
+    assert 0 < kwargs["timeout"] <= 5000
+    page.locator.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_wait_for_sources_button_when_timeout():
+@pytest.mark.parametrize("verbose", [True, False])
+async def test_wait_for_sources_button_when_timeout(verbose, monkeypatch):
     """Sources button wait helper falls back gracefully on timeout."""
+    monkeypatch.setattr(gemini, "_verbose_sink_id", 1 if verbose else None)
     page = MagicMock()
-    button = MagicMock()
-    button.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("timeout"))
-    page.get_by_role.return_value = button
+    page.wait_for_function = AsyncMock(side_effect=PlaywrightTimeoutError("timeout"))
+    page.evaluate = AsyncMock(return_value={"content_length": 13})
     page.content = AsyncMock(return_value="<html></html>")
 
     await _wait_for_sources_button(page, timeout=1)
 
-    button.wait_for.assert_awaited_once_with(state="visible", timeout=1000)
-    page.content.assert_awaited_once()
+    page.wait_for_function.assert_awaited_once()
+    # The page snapshot is only taken when there is debug output to put it in
+    assert page.evaluate.await_args_list == ([call(gemini._PAGE_SNAPSHOT_JS)] if verbose else [])
+    page.content.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_extract_sources_content_reads_cards_in_one_call():
+    """Source cards should be read with a single evaluate and formatted in Python."""
+    sources_button = AsyncMock()
+    sources_button.first.is_visible.return_value = True
+    sidebar = AsyncMock()
+    sidebar.evaluate.return_value = [
+        {"title": " Paper ", "url": "https://example.com/a", "snippet": " Summary "},
+        {"title": "Site", "url": "https://example.com/b", "snippet": ""},
+        {"title": "", "url": "https://example.com/c", "snippet": "untitled"},
+    ]
+    mock_page = MagicMock()
+    mock_page.locator.side_effect = lambda selector: sidebar if selector == "context-sidebar" else sources_button
+
+    result = await _extract_sources_content(mock_page)
+
+    assert result == "**Paper**\nhttps://example.com/a\nSummary\n\n**Site**\nhttps://example.com/b"
+    sidebar.evaluate.assert_awaited_once()
+    sidebar.inner_html.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_any_waits_once_on_union():
+    """Selector probes should share one wait and prefer the earliest visible selector."""
+    locators = {}
+
+    def locator(selector):
+        return locators.setdefault(selector, AsyncMock(first=AsyncMock(), last=AsyncMock()))
+
+    mock_page = MagicMock()
+    mock_page.locator.side_effect = locator
+    locator("a").last.is_visible.return_value = False
+    locator("b").last.is_visible.return_value = True
+
+    result = await _wait_for_any(mock_page, ("a", "b"), timeout=1000, last=True)
+
+    assert result is locators["b"].last
+    locators["a, b"].last.wait_for.assert_awaited_once_with(state="visible", timeout=1000)
+
+    locators["a, b"].last.wait_for.side_effect = PlaywrightTimeoutError("timeout")
+    assert await _wait_for_any(mock_page, ("a", "b"), timeout=1000, last=True) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("clicked_in_page", [True, False])
+async def test_activate_deep_research_checks_selection_at_document_level(clicked_in_page):
+    """The activation check must not wait on the tool button, which closes with its drawer."""
+    button = AsyncMock()
+    button.text_content.return_value = "Deep Research"
+    button.locator = MagicMock(return_value=button)
+    button.first = button
+    mock_page = MagicMock()
+    mock_page.get_by_role.return_value = AsyncMock()
+    mock_page.locator.return_value = button
+    mock_page.evaluate = AsyncMock(side_effect=[clicked_in_page, True])
+
+    await _activate_deep_research(mock_page)
+
+    assert mock_page.evaluate.await_args_list == [
+        call(gemini._CLICK_DRAWER_TOOL_JS, ["Deep Research", 10_000]),
+        call(gemini._AWAIT_DEEP_RESEARCH_ACTIVE_JS, 5000),
+    ]
+    assert button.click.await_count == int(not clicked_in_page)
+    button.evaluate.assert_not_called()
+
+    # An unconfirmed selection is logged, not raised
+    mock_page.evaluate.side_effect = [True, None]
+    await _activate_deep_research(mock_page)
+
+
+@pytest.mark.asyncio
+async def test_activate_deep_think_waits_for_drawer_to_close():
+    """After picking the tool, wait on the drawer, not on the tool label that stays on the chip."""
+    locators = {}
+    mock_page = MagicMock()
+    mock_page.get_by_role.return_value = AsyncMock()
+    mock_page.locator.side_effect = lambda selector: locators.setdefault(selector, AsyncMock())
+
+    await _activate_deep_think(mock_page)
+
+    locators["button:has-text('Deep Think')"].first.click.assert_awaited_once()
+    locators["#cdk-overlay-0 > mat-card"].wait_for.assert_awaited_once_with(state="hidden", timeout=5000)
+    locators["button:has-text('Deep Think')"].first.wait_for.assert_awaited_once_with(state="visible", timeout=10000)
+
+
+def test_configure_logging_manages_only_its_own_sink(monkeypatch):
+    """Verbose calls should add one stdout sink and never remove sinks they did not add."""
+    monkeypatch.setattr(gemini, "_verbose_sink_id", None)
+    with patch("playpi.providers.google.gemini.logger") as mock_logger:
+        mock_logger.add.return_value = 7
+        gemini._configure_logging(verbose=True)
+        gemini._configure_logging(verbose=True)
+        mock_logger.add.assert_called_once()
+        mock_logger.remove.assert_not_called()
+
+        gemini._configure_logging(verbose=False)
+        gemini._configure_logging(verbose=False)
+        mock_logger.remove.assert_called_once_with(7)
+        mock_logger.disable.assert_called_with("playpi")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("evaluate_result", [True, False, RuntimeError("detached")])
+async def test_enter_prompt_inserts_in_one_call_with_fill_fallback(evaluate_result):
+    """The prompt should be inserted in-page, falling back to click + fill if that fails."""
+    text_input = AsyncMock()
+    if isinstance(evaluate_result, Exception):
+        text_input.evaluate.side_effect = evaluate_result
+    else:
+        text_input.evaluate.return_value = evaluate_result
+
+    with patch("playpi.providers.google.gemini._wait_for_any", AsyncMock(return_value=text_input)):
+        await _enter_prompt(MagicMock(), "hello")
+
+    text_input.evaluate.assert_awaited_once()
+    if evaluate_result is True:
+        text_input.fill.assert_not_called()
+    else:
+        text_input.fill.assert_awaited_once_with("hello")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_observes_markers_in_page():
+    """Completion should be awaited in-page, with :has-text selectors split into CSS and text."""
+    mock_page = AsyncMock()
+    mock_page.evaluate.side_effect = [["button", "Export"], True]
+    reporter = AsyncMock()
+
+    with patch("playpi.providers.google.gemini._report_research_progress", reporter):
+        await _wait_for_completion(mock_page, timeout=600)
+
+    observe_call, settle_call = mock_page.evaluate.await_args_list
+    # After completion, rendering is awaited as a DOM quiet period rather than a fixed sleep
+    assert settle_call.args == (
+        gemini._AWAIT_DOM_QUIET_JS,
+        [gemini.RENDER_QUIET_MS, gemini.RENDER_SETTLE_TIMEOUT_MS],
+    )
+    markers, timeout_ms = observe_call.args[1]
+    assert ["button", "Export"] in [list(marker) for marker in markers]
+    assert 590_000 < timeout_ms <= 600_000
+    reporter.assert_called_once()
+    mock_page.content.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("verbose", [True, False])
+async def test_extract_simple_response_dumps_html_only_when_verbose(verbose, tmp_path, monkeypatch):
+    """The debug HTML dump should be written off-loop, and only in verbose mode."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(gemini, "_verbose_sink_id", 1 if verbose else None)
+    mock_page = AsyncMock()
+    mock_page.locator = MagicMock()
+    mock_page.locator.return_value.last.wait_for = AsyncMock(side_effect=PlaywrightTimeoutError("no response"))
+    mock_page.content.return_value = "<html>debug</html>"
+    mock_page.evaluate.return_value = ["Recovered paragraph"]
+
+    assert await _extract_simple_response(mock_page) == "Recovered paragraph"
+
+    debug_file = tmp_path / "tmp" / "gemini_response_debug.html"
+    assert debug_file.exists() is verbose
+    assert mock_page.content.await_count == int(verbose)
+
+
+@pytest.mark.asyncio
+async def test_extract_simple_response_reads_html_in_one_call():
+    """Choosing the response element and reading its HTML should be a single evaluate."""
+    mock_page = AsyncMock()
+    mock_page.locator = MagicMock()
+    mock_page.locator.return_value.last.wait_for = AsyncMock()
+    mock_page.evaluate.return_value = ["message-content", "<p>Hello</p>"]
+
+    assert (await _extract_simple_response(mock_page)).strip() == "Hello"
+    mock_page.evaluate.assert_awaited_once_with(gemini._LAST_VISIBLE_HTML_JS, list(gemini.RESPONSE_SELECTORS))
+
+
+@pytest.mark.asyncio
+async def test_report_research_progress_reads_steps_and_status_in_one_call():
+    """Each progress tick should query the page once for both steps and status."""
+    mock_page = AsyncMock()
+    mock_page.evaluate.return_value = {"steps": 4, "status": "Ready in 3 minutes"}
+
+    with (
+        patch("playpi.providers.google.gemini.asyncio.sleep", AsyncMock(side_effect=[None, asyncio.CancelledError])),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await gemini._report_research_progress(mock_page, asyncio.get_running_loop().time())
+
+    mock_page.evaluate.assert_awaited_once_with(gemini._RESEARCH_PROGRESS_JS)
+    mock_page.locator.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_click_send_button_relies_on_click_auto_wait():
+    """The send button should be clicked without a separate visibility wait."""
+    send_button = AsyncMock()
+    mock_page = MagicMock()
+    mock_page.locator.return_value.or_.return_value.first = send_button
+
+    await _click_send_button(mock_page)
+
+    mock_page.locator.return_value.or_.assert_called_once_with(mock_page.get_by_role.return_value)
+    send_button.click.assert_awaited_once_with(timeout=10000)
+    send_button.wait_for.assert_not_called()
+    send_button.count.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("content_length", "completes"), [(gemini.RESEARCH_CONTENT_MIN_LENGTH + 1, True), (10, False)])
+async def test_wait_for_completion_falls_back_to_page_snapshot(content_length, completes):
+    """Without a completion marker, one page snapshot decides whether research finished."""
+    mock_page = AsyncMock()
+    mock_page.evaluate.side_effect = [None, {"content_length": content_length, "research_steps": 3}, True]
+
+    with patch("playpi.providers.google.gemini._report_research_progress", AsyncMock()):
+        if completes:
+            await _wait_for_completion(mock_page, timeout=1)
+        else:
+            with pytest.raises(PlayPiTimeoutError):
+                await _wait_for_completion(mock_page, timeout=1)
+
+    assert mock_page.evaluate.await_args_list[1].args == (gemini._PAGE_SNAPSHOT_JS,)
+    mock_page.content.assert_not_called()
@@ -2,12 +2,14 @@
 """Tests for Google provider functionality."""
 
 import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from playpi import google_gemini_deep_research as google_deep_research_public
 from playpi.example_prompts import PROMPT_EN
 from playpi.exceptions import AuthenticationError, ProviderError
+from playpi.providers.google import auth
 from playpi.providers.google import google_gemini_deep_research as google_deep_research
 
 
@@ -53,3 +55,23 @@ def test_google_deep_research_parameters():
     assert sig.parameters["timeout"].default == 600
     assert sig.parameters["profile"].default is None
     assert sig.parameters["verbose"].default is False
+
+
+@pytest.mark.asyncio
+async def test_ensure_authenticated_backs_off_between_login_checks():
+    """Login checks should start quickly and slow down while the user signs in."""
+    page = MagicMock()
+    page.url = "https://accounts.google.com/signin"
+    page.wait_for_load_state = AsyncMock()
+    sleep = AsyncMock()
+
+    with (
+        patch.object(auth, "has_chat_interface", AsyncMock(side_effect=[False] * 8 + [True])),
+        patch.object(auth.asyncio, "sleep", sleep),
+    ):
+        await auth.ensure_authenticated(page, timeout=60)
+
+    intervals = [interval for (interval,), _ in sleep.await_args_list]
+    assert intervals[0] == auth.LOGIN_POLL_MIN_INTERVAL
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == auth.LOGIN_POLL_MAX_INTERVAL
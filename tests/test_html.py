@@ -1,7 +1,12 @@
 # this_file: tests/test_html.py
 """Tests for HTML processing utilities."""
 
-from playpi.html import html_to_markdown
+from unittest.mock import AsyncMock
+
+import pytest
+from playwrightauthor.utils.html import html_to_markdown as playwrightauthor_html_to_markdown
+
+from playpi.html import CONTENT_SELECTORS, extract_research_content, html_to_markdown
 
 
 def test_html_to_markdown_basic():
@@ -35,6 +40,29 @@ def test_html_to_markdown_lists():
     assert "* Item 2" in result
 
 
+def test_html_to_markdown_images():
+    """Test that images are skipped unless requested."""
+    html = '<p>Chart</p><img src="https://example.com/chart.png" alt="chart">'
+
+    assert "chart.png" not in html_to_markdown(html)
+    assert "![chart](https://example.com/chart.png)" in html_to_markdown(html, keep_images=True)
+
+
+def test_html_to_markdown_matches_playwrightauthor():
+    """Providers switched from playwrightauthor's converter; only image handling differs."""
+    html = """
+    <h2>Findings</h2>
+    <p>See <a href="https://example.com/a">the report</a> and <a href="#ref-1">note 1</a>.</p>
+    <ol><li>First &amp; <em>foremost</em></li><li>Second</li></ol>
+    <img src="https://example.com/chart.png" alt="chart">
+    <pre><code>print("hi")</code></pre>
+    """
+    expected = playwrightauthor_html_to_markdown(html)
+
+    assert html_to_markdown(html, keep_images=True) == expected
+    assert html_to_markdown(html) == expected.replace("![chart](https://example.com/chart.png)\n\n", "")
+
+
 def test_html_to_markdown_empty():
     """Test empty HTML conversion."""
     result = html_to_markdown("")
@@ -58,3 +86,18 @@ def test_html_to_markdown_whitespace_cleanup():
     assert "\n\n\n" not in result
     assert result.strip().startswith("# Title")
     assert result.strip().endswith("Paragraph")
+
+
+@pytest.mark.asyncio
+async def test_extract_research_content_probes_selectors_in_one_call():
+    """Content containers should be probed in one evaluate, falling back to the body."""
+    page = AsyncMock()
+    page.evaluate.return_value = [CONTENT_SELECTORS[1], "<p>Findings</p>"]
+
+    assert await extract_research_content(page) == "<p>Findings</p>"
+    page.evaluate.assert_awaited_once()
+    assert page.evaluate.await_args.args[1] == list(CONTENT_SELECTORS)
+
+    page.evaluate.return_value = None
+    page.locator = lambda _selector: AsyncMock(inner_html=AsyncMock(return_value="<body>all</body>"))
+    assert await extract_research_content(page) == "<body>all</body>"
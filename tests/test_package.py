@@ -1,5 +1,8 @@
 """Test suite for playpi."""
 
+import subprocess
+import sys
+
 import playpi
 
 
@@ -7,3 +10,11 @@ def test_version():
     """Verify package exposes version."""
 
     assert playpi.__version__
+
+
+def test_import_defers_playwrightauthor():
+    """Importing playpi should not load playwrightauthor until a session starts."""
+
+    code = "import sys, playpi; print('playwrightauthor' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip() == "False"
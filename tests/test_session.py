@@ -1,6 +1,9 @@
 # this_file: tests/test_session.py
 """Tests for PlayPi session management built on playwrightauthor."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from playpi.config import PlayPiConfig
@@ -8,19 +11,30 @@ from playpi.exceptions import BrowserError, SessionError
 from playpi.session import PlayPiSession, create_session
 
 
-async def _ensure_session(config: PlayPiConfig | None = None) -> PlayPiSession:
-    session = PlayPiSession(config)
+@pytest.fixture(scope="module")
+def real_browser() -> None:
+    """Skip the real-browser tests when playwrightauthor cannot start Chrome here.
+
+    Probed once per module, so a missing browser costs one failed start instead
+    of one per test.
+    """
+
+    async def probe() -> None:
+        async with create_session(PlayPiConfig(timeout=10_000)):
+            pass
+
     try:
-        await session.start()
-        return session
+        asyncio.run(probe())
     except BrowserError as exc:  # pragma: no cover - dependent on local Chrome setup
         pytest.skip(f"playwrightauthor unavailable: {exc}")
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("real_browser")
 async def test_session_lifecycle():
     config = PlayPiConfig(timeout=10_000)
-    session = await _ensure_session(config)
+    session = PlayPiSession(config)
+    await session.start()
 
     new_session = PlayPiSession(config)
     with pytest.raises(SessionError):
@@ -37,17 +51,16 @@ async def test_session_lifecycle():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("real_browser")
 async def test_session_context_manager():
     config = PlayPiConfig(timeout=10_000)
-    try:
-        async with create_session(config) as session:
-            page = await session.get_page()
-            assert page is not None
-    except BrowserError as exc:  # pragma: no cover - depends on local Chrome setup
-        pytest.skip(f"playwrightauthor unavailable: {exc}")
+    async with create_session(config) as session:
+        page = await session.get_page()
+        assert page is not None
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("real_browser")
 async def test_create_session_helper():
     config = PlayPiConfig(timeout=10_000)
 
@@ -57,6 +70,7 @@ async def test_create_session_helper():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("real_browser")
 async def test_get_authenticated_page():
     config = PlayPiConfig(timeout=10_000)
 
@@ -66,7 +80,125 @@ async def test_get_authenticated_page():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("real_browser")
 async def test_session_with_default_config():
     async with create_session() as session:
         page = await session.get_page()
         assert page is not None
+
+
+def _mock_context() -> AsyncMock:
+    context = AsyncMock()
+    context.new_page.side_effect = lambda: MagicMock(
+        is_closed=MagicMock(return_value=False), close=AsyncMock(), goto=AsyncMock(), bring_to_front=AsyncMock()
+    )
+    return context
+
+
+def _mock_async_browser(context):
+    browser = MagicMock(contexts=[context])
+    async_browser = MagicMock()
+    async_browser.__aenter__ = AsyncMock(return_value=browser)
+    async_browser.__aexit__ = AsyncMock(return_value=False)
+    return async_browser
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("block_telemetry", [False, True])
+async def test_session_telemetry_blocking_is_opt_in(block_telemetry):
+    context = _mock_context()
+    with patch("playwrightauthor.AsyncBrowser", return_value=_mock_async_browser(context)):
+        async with create_session(PlayPiConfig(block_telemetry=block_telemetry)) as session:
+            await session.get_authenticated_page("google")
+
+    assert context.route.await_count == int(block_telemetry)
+
+
+@pytest.mark.asyncio
+async def test_acquire_page_reuses_returned_pages():
+    context = _mock_context()
+    with patch("playwrightauthor.AsyncBrowser", return_value=_mock_async_browser(context)):
+        async with create_session() as session:
+            async with session.acquire_page() as first:
+                pass
+            async with session.acquire_page() as second:
+                assert second is first
+            first.goto.assert_awaited_with("about:blank")
+
+            crash = RuntimeError("page crashed")
+            with pytest.raises(RuntimeError):
+                async with session.acquire_page() as failed:
+                    raise crash
+            failed.close.assert_awaited()
+
+            async with session.acquire_page() as fresh:
+                assert fresh is not failed
+
+
+@pytest.mark.asyncio
+async def test_get_page_skips_pages_lent_by_acquire_page():
+    context = _mock_context()
+    with patch("playwrightauthor.AsyncBrowser", return_value=_mock_async_browser(context)):
+        async with create_session() as session:
+            initial = await session.get_page()
+            async with session.acquire_page() as lent:
+                assert lent is not initial
+                assert await session.get_page() is initial
+            assert await session.get_page() is initial
+
+            async with session.acquire_page() as reused:
+                assert reused is lent
+
+
+@pytest.mark.asyncio
+async def test_session_forgets_closed_pages():
+    context = _mock_context()
+    with patch("playwrightauthor.AsyncBrowser", return_value=_mock_async_browser(context)):
+        async with create_session() as session:
+            first = await session.get_page()
+            second = await session.new_page()
+            on_close = second.on.call_args.args[1]
+
+            on_close(second)  # The page emitted "close"
+            assert await session.get_page() is first
+
+    first.close.assert_awaited_once()
+    second.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_start_releases_the_browser():
+    context = _mock_context()
+    context.new_page.side_effect = asyncio.CancelledError
+    async_browser = _mock_async_browser(context)
+    session = PlayPiSession()
+
+    with patch("playwrightauthor.AsyncBrowser", return_value=async_browser), pytest.raises(asyncio.CancelledError):
+        await session.start()
+
+    async_browser.__aexit__.assert_awaited_once()
+    with pytest.raises(SessionError):
+        await session.new_page()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_close_tears_down_once_in_order():
+    events = []
+    context = _mock_context()
+    async_browser = _mock_async_browser(context)
+    async_browser.__aexit__.side_effect = lambda *_: events.append("browser")
+
+    with patch("playwrightauthor.AsyncBrowser", return_value=async_browser):
+        session = PlayPiSession()
+        await session.start()
+    page = await session.get_page()
+
+    async def close_page():
+        await asyncio.sleep(0)
+        events.append("page")
+
+    page.close.side_effect = close_page
+
+    await asyncio.gather(session.close(), session.close())
+
+    assert events == ["page", "browser"]